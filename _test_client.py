@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Cliente HTTP compartilhado pelos scripts de teste da interface web
+(quick_test.py, test_models.py, test_all_models.py, test_audio_fix.py).
+"""
+
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Cliente HTTP assíncrono, opcional (pip install httpx)
+    import httpx
+except ImportError:
+    httpx = None
+
+BASE_URL = "http://localhost:5000"
+
+# Sessão única: reaproveita as conexões com o servidor entre as requisições.
+# Conexão recusada (servidor ainda subindo) e HTTP 429 são repetidos com
+# backoff, no lugar de pausas fixas entre os testes
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # Sem retry de leitura: um POST que expirou pode já ter sido processado
+    max_retries=Retry(
+        connect=3, read=0, status=3, backoff_factor=0.5, status_forcelist=[429],
+        allowed_methods=None, raise_on_status=False,
+    ),
+))
+
+# Exceções equivalentes dos dois clientes, para os scripts tratarem os
+# resultados de post_all sem saber qual deles foi usado
+TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+CONNECT_ERRORS = (requests.exceptions.ConnectionError,)
+HTTP_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    CONNECT_ERRORS += (httpx.ConnectError,)
+    HTTP_ERRORS += (httpx.HTTPError,)
+
+def post_test_voice(model_name, text, timeout=30, base_url=BASE_URL):
+    """Pede ao servidor um áudio de teste do modelo (POST /test_voice)."""
+    return SESSION.post(
+        f"{base_url}/test_voice",
+        json={"model_name": model_name, "text": text},
+        timeout=timeout
+    )
+
+async def post_all(cases, timeout=30, base_url=BASE_URL):
+    """Envia os pares (modelo, texto) a /test_voice ao mesmo tempo.
+
+    Retorna, na ordem de cases, a resposta de cada pedido ou a exceção que
+    ele levantou. Usa httpx.AsyncClient num único event loop quando o httpx
+    está instalado; caso contrário, a sessão requests em threads.
+    """
+    if httpx is None:
+        return await asyncio.gather(
+            *(asyncio.to_thread(post_test_voice, model_name, text, timeout, base_url)
+              for model_name, text in cases),
+            return_exceptions=True,
+        )
+
+    transport = httpx.AsyncHTTPTransport(retries=3)  # conexão recusada
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport) as client:
+        return await asyncio.gather(
+            *(client.post("/test_voice", json={"model_name": model_name, "text": text})
+              for model_name, text in cases),
+            return_exceptions=True,
+        )
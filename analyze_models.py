@@ -2,43 +2,58 @@
 """Script para analisar os modelos de voz"""
 
 import json
+import multiprocessing
 import os
 
+try:  # Parser JSON em C, opcional (pip install orjson)
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 def analyze_model(model_name):
-    """Analisa um modelo específico"""
+    """Analisa um modelo específico e retorna um resumo (sem imprimir)"""
     config_path = f'trained_models/{model_name}/{model_name}.onnx.json'
     
     if not os.path.exists(config_path):
-        print(f"❌ Arquivo não encontrado: {config_path}")
-        return
+        return {'model': model_name, 'error': f"Arquivo não encontrado: {config_path}"}
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = _loads(f.read())
         
         phoneme_id_map = config.get('phoneme_id_map', {})
         
-        # Encontrar ID máximo
-        max_id = 0
-        for phoneme, ids in phoneme_id_map.items():
-            for id_val in ids:
-                max_id = max(max_id, id_val)
-        
-        print(f"\n📊 Análise do modelo: {model_name}")
-        print(f"   📍 Total de fonemas: {len(phoneme_id_map)}")
-        print(f"   📈 ID máximo: {max_id}")
-        print(f"   🔤 Tipo de fonema: {config.get('phoneme_type', 'desconhecido')}")
-        print(f"   🗣️  Voz espeak: {config.get('espeak', {}).get('voice', 'não definida')}")
+        # Encontrar ID máximo (listas vazias são ignoradas)
+        max_id = max(map(max, filter(None, phoneme_id_map.values())), default=0)
         
-        # Verificar se há mapa de caracteres
-        if 'phoneme_map' in config and config['phoneme_map']:
-            print(f"   🗺️  Mapa de fonemas: {len(config['phoneme_map'])} entradas")
-        
-        return max_id
+        return {
+            'model': model_name,
+            'max_id': max_id,
+            'n_phonemes': len(phoneme_id_map),
+            'phoneme_type': config.get('phoneme_type', 'desconhecido'),
+            'espeak_voice': config.get('espeak', {}).get('voice', 'não definida'),
+            'phoneme_map_size': len(config['phoneme_map']) if config.get('phoneme_map') else None,
+        }
         
     except Exception as e:
-        print(f"❌ Erro ao analisar {model_name}: {e}")
-        return None
+        return {'model': model_name, 'error': f"Erro ao analisar {model_name}: {e}"}
+
+def print_analysis(result):
+    """Exibe o resumo produzido por analyze_model"""
+    if 'error' in result:
+        print(f"❌ {result['error']}")
+        return
+    
+    print(f"\n📊 Análise do modelo: {result['model']}")
+    print(f"   📍 Total de fonemas: {result['n_phonemes']}")
+    print(f"   📈 ID máximo: {result['max_id']}")
+    print(f"   🔤 Tipo de fonema: {result['phoneme_type']}")
+    print(f"   🗣️  Voz espeak: {result['espeak_voice']}")
+    
+    # Verificar se há mapa de caracteres
+    if result['phoneme_map_size']:
+        print(f"   🗺️  Mapa de fonemas: {result['phoneme_map_size']} entradas")
 
 def main():
     """Função principal"""
@@ -46,11 +61,17 @@ def main():
     
     models = ['faber_pt_br', 'amy_en_us', 'lessac_en_us', 'voz_teste']
     
+    # Cada modelo é independente: analisa em paralelo e imprime no processo
+    # principal, na ordem original, para não intercalar a saída.
+    processes = min(len(models), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes=processes) as pool:
+        results = pool.map(analyze_model, models)
+    
     max_ids = {}
-    for model in models:
-        max_id = analyze_model(model)
-        if max_id is not None:
-            max_ids[model] = max_id
+    for result in results:
+        print_analysis(result)
+        if 'error' not in result:
+            max_ids[result['model']] = result['max_id']
     
     print("\n" + "="*50)
     print("📊 RESUMO DOS MODELOS")
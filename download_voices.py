@@ -8,27 +8,85 @@ repositório oficial (`rhasspy/piper-voices`) e baixa os arquivos
 ⚠️ Atenção: baixar todas as vozes consome dezenas de gigabytes.
 Use os filtros disponíveis (`--language`, `--quality`, `--search`)
 para limitar o download conforme necessário.
+
+Os arquivos baixados ficam em cache (`$PIPER_CACHE`, por padrão
+`~/.cache/piper-voices`) e são revalidados pelo ETag, de modo que
+execuções repetidas não transferem novamente modelos inalterados.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import hashlib
 import json
 import logging
+import mmap
 import os
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # Parser incremental opcional para o catálogo (pip install ijson)
+    import ijson
+except ImportError:  # pragma: no cover - dependência opcional
+    ijson = None
+
+try:  # Parser JSON em C, usado quando ijson não está disponível
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - dependência opcional
+    _loads = json.loads
+
+try:  # Hash SIMD opcional para revalidar arquivos locais (pip install blake3)
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - dependência opcional
+    blake3 = None
+
+try:  # Motor assíncrono opcional para os downloads (pip install aiohttp)
+    import aiohttp
+except ImportError:  # pragma: no cover - dependência opcional
+    aiohttp = None
 
 VOICES_JSON_URL = "https://huggingface.co/rhasspy/piper-voices/raw/main/voices.json"
 HF_BASE_RESOLVE = "https://huggingface.co/rhasspy/piper-voices/resolve/main/"
+DEFAULT_WORKERS = 4
+# Modelos a partir deste tamanho são baixados em partes paralelas (HTTP Range).
+RANGE_THRESHOLD = 16 << 20
+RANGE_PARTS = 4
+CACHE_DIR = Path(os.getenv("PIPER_CACHE", "~/.cache/piper-voices")).expanduser()
 
 logger = logging.getLogger("download_voices")
 
+# Snapshot (caminho -> stat) dos arquivos já presentes em `trained_models`.
+LocalFiles = Dict[Path, os.stat_result]
+
+# Sessão compartilhada: reaproveita conexões (keep-alive) entre os downloads.
+SESSION = requests.Session()
+
+
+def configure_session(workers: int) -> None:
+    """Dimensiona o pool de conexões da sessão para o número de workers."""
+
+    # Cada voz baixa o `.onnx` (em até RANGE_PARTS partes) e o `.onnx.json`.
+    pool_size = max(1, workers) * (RANGE_PARTS + 1)
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+    )
+    SESSION.mount("https://", adapter)
+    SESSION.mount("http://", adapter)
+
+
+configure_session(DEFAULT_WORKERS)
+
 
 @dataclass
 class Voice:
@@ -46,138 +104,647 @@ class Voice:
 
         return self.key.replace("/", "-")
 
+    @property
+    def local_dir(self) -> Path:
+        """Diretório local onde os arquivos da voz são gravados."""
+
+        return Path("trained_models") / self.short_slug
+
+
+def is_model_file(rel_path: str) -> bool:
+    """Indica se o caminho corresponde a um modelo ou à sua configuração."""
+
+    return rel_path.endswith(".onnx") or rel_path.endswith(".onnx.json")
+
+
+def parse_voice(key: str, info: Dict) -> Voice:
+    """Converte uma entrada do catálogo em `Voice`, descartando o restante."""
+
+    language = info.get("language", {}) or {}
+    files = {
+        rel_path: metadata
+        for rel_path, metadata in (info.get("files", {}) or {}).items()
+        if is_model_file(rel_path)
+    }
+    return Voice(
+        key=key,
+        language_code=str(language.get("code", "")).lower(),
+        language_family=str(language.get("family")) if language.get("family") else None,
+        quality=str(info.get("quality", "unknown")),
+        files=files,
+    )
+
 
 def fetch_catalog() -> Dict[str, Voice]:
-    """Carrega o catálogo oficial de vozes."""
+    """Carrega o catálogo oficial de vozes.
 
-    logger.info("🔄 Baixando catálogo de vozes: %s", VOICES_JSON_URL)
-    response = requests.get(VOICES_JSON_URL, timeout=60)
-    response.raise_for_status()
+    Com `ijson` instalado o `voices.json` é lido de forma incremental enquanto
+    chega pela rede; sem ele, o documento inteiro é decodificado de uma vez
+    (com `orjson`, se disponível).
+    """
 
-    raw_catalog = response.json()
+    logger.info("🔄 Baixando catálogo de vozes: %s", VOICES_JSON_URL)
     catalog: Dict[str, Voice] = {}
 
-    for key, info in raw_catalog.items():
-        language = info.get("language", {}) or {}
-        catalog[key] = Voice(
-            key=key,
-            language_code=str(language.get("code", "")).lower(),
-            language_family=str(language.get("family")) if language.get("family") else None,
-            quality=str(info.get("quality", "unknown")),
-            files=info.get("files", {}),
-        )
+    with SESSION.get(VOICES_JSON_URL, stream=True, timeout=60) as response:
+        response.raise_for_status()
+
+        if ijson is not None:
+            response.raw.decode_content = True
+            entries = ijson.kvitems(response.raw, "")
+        else:
+            entries = _loads(response.content).items()
+
+        for key, info in entries:
+            catalog[key] = parse_voice(key, info)
 
     logger.info("📚 Catálogo carregado: %s vozes", len(catalog))
     return catalog
 
 
-def should_include(voice: Voice, args: argparse.Namespace) -> bool:
-    """Aplica filtros de linguagem/qualidade/pesquisa."""
+def build_filter(args: argparse.Namespace) -> Callable[[Voice], bool]:
+    """Pré-processa os filtros da CLI e retorna o predicado por voz.
+
+    A normalização (minúsculas, conjuntos) acontece uma única vez; filtros
+    não informados nem entram nas checagens.
+    """
+
+    checks: list[Callable[[Voice], bool]] = []
 
     if args.languages:
-        candidates = {voice.language_code, voice.language_code.split("-")[0]}
-        if candidates.isdisjoint({lang.lower() for lang in args.languages}):
-            return False
+        languages = frozenset(lang.lower() for lang in args.languages)
+        checks.append(
+            lambda voice: voice.language_code in languages
+            or voice.language_code.split("-")[0] in languages
+        )
 
     if args.only_portuguese:
-        if not voice.language_code.startswith("pt"):
-            return False
+        checks.append(lambda voice: voice.language_code.startswith("pt"))
 
-    if args.qualities and voice.quality not in args.qualities:
-        return False
+    if args.qualities:
+        qualities = frozenset(args.qualities)
+        checks.append(lambda voice: voice.quality in qualities)
 
     if args.search:
         keyword = args.search.lower()
-        if keyword not in voice.key.lower():
-            return False
+        checks.append(lambda voice: keyword in voice.key.lower())
 
-    return True
+    if not checks:
+        return lambda voice: True
+    return lambda voice: all(check(voice) for check in checks)
 
 
 def iter_voice_files(voice: Voice) -> Iterator[tuple[str, Path, Dict[str, str]]]:
-    """Gera tuplas (url_relativa, caminho_destino, metadados)."""
+    """Gera tuplas (url_relativa, caminho_destino, metadados).
+
+    No layout do HuggingFace a configuração é sempre `<modelo>.onnx.json`,
+    então basta localizar o `.onnx` e consultar o irmão diretamente.
+    """
+
+    onnx_path = next((rel_path for rel_path in voice.files if rel_path.endswith(".onnx")), None)
+    if onnx_path is None:
+        return
+
+    for rel_path, suffix in ((onnx_path, ".onnx"), (onnx_path + ".json", ".onnx.json")):
+        metadata = voice.files.get(rel_path)
+        if metadata is not None:
+            yield rel_path, voice.local_dir / f"{voice.short_slug}{suffix}", metadata
+
+
+def compute_md5(path: Path) -> str:
+    """Calcula o MD5 de um arquivo local.
+
+    O arquivo é mapeado em memória e entregue inteiro ao MD5 do OpenSSL,
+    sem cópias intermediárias em blocos Python.
+    """
+
+    with path.open("rb") as handle:
+        fd = handle.fileno()
+        if os.fstat(fd).st_size == 0:  # mmap não aceita arquivos vazios
+            return hashlib.md5().hexdigest()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.md5(mapped).hexdigest()
+
 
-    dest_dir = Path("trained_models") / voice.short_slug
-    dest_dir.mkdir(parents=True, exist_ok=True)
+def compute_blake3(path: Path) -> str:
+    """Calcula o BLAKE3 de um arquivo local (multithread, via mmap)."""
 
-    for rel_path, metadata in voice.files.items():
-        if not (rel_path.endswith(".onnx") or rel_path.endswith(".onnx.json")):
-            continue
+    hasher = blake3(max_threads=blake3.AUTO)
+    hasher.update_mmap(path)
+    return hasher.hexdigest()
 
-        suffix = ".onnx" if rel_path.endswith(".onnx") else ".onnx.json"
-        dest_file = dest_dir / f"{voice.short_slug}{suffix}"
-        yield rel_path, dest_file, metadata
+
+def blake3_sidecar(path: Path) -> Path:
+    """Arquivo auxiliar com o BLAKE3 de um arquivo já validado por MD5."""
+
+    return path.with_name(path.name + ".b3")
+
+
+def read_blake3_sidecar(path: Path, expected_md5: str) -> str | None:
+    """Retorna o BLAKE3 registrado, se ainda vale para o arquivo atual.
+
+    O registro é descartado quando o MD5 esperado, o tamanho ou o mtime do
+    arquivo mudaram desde a validação.
+    """
+
+    try:
+        record = json.loads(blake3_sidecar(path).read_text(encoding="utf-8"))
+        stat = path.stat()
+    except (OSError, ValueError):
+        return None
+
+    if (
+        record.get("md5") != expected_md5
+        or record.get("size") != stat.st_size
+        or record.get("mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+    return record.get("blake3")
+
+
+def write_blake3_sidecar(path: Path, expected_md5: str) -> None:
+    """Registra o BLAKE3 de um arquivo cujo MD5 acabou de ser validado."""
+
+    stat = path.stat()
+    record = {
+        "md5": expected_md5,
+        "blake3": compute_blake3(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+    try:
+        blake3_sidecar(path).write_text(json.dumps(record), encoding="utf-8")
+    except OSError as exc:
+        logger.debug("Não foi possível gravar %s: %s", blake3_sidecar(path), exc)
 
 
 def file_matches_md5(path: Path, expected_md5: str | None) -> bool:
-    """Verifica se arquivo existente corresponde ao hash esperado."""
+    """Verifica se arquivo existente corresponde ao hash esperado.
+
+    Com `blake3` instalado, a primeira validação por MD5 deixa um registro
+    `.b3` ao lado do arquivo; as seguintes usam o BLAKE3, bem mais rápido.
+    """
 
     if not expected_md5 or not path.exists():
         return False
 
-    md5 = hashlib.md5()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            md5.update(chunk)
+    known_blake3 = read_blake3_sidecar(path, expected_md5) if blake3 is not None else None
+    if known_blake3 is not None:
+        match = compute_blake3(path) == known_blake3
+    else:
+        match = compute_md5(path) == expected_md5
+        if match and blake3 is not None:
+            write_blake3_sidecar(path, expected_md5)
 
-    match = md5.hexdigest() == expected_md5
     if match:
-        logger.debug("👍 Hash MD5 coincide para %s", path)
+        logger.debug("👍 Hash coincide para %s", path)
     else:
         logger.warning("⚠️ Hash MD5 divergente: %s (esperado %s)", path, expected_md5)
     return match
 
 
-def download_file(url: str, destination: Path) -> None:
-    """Efetua download via streaming."""
+@dataclass
+class Download:
+    """Resultado de uma requisição de download."""
+
+    md5: str | None
+    etag: str | None
+    not_modified: bool = False
+
+
+class HashingWriter:
+    """Envolve um arquivo binário atualizando um MD5 a cada escrita."""
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self.handle = handle
+        self.md5 = hashlib.md5()
+
+    def write(self, data: bytes) -> int:
+        self.md5.update(data)
+        return self.handle.write(data)
+
+    def hexdigest(self) -> str:
+        return self.md5.hexdigest()
+
+
+def request_headers(url: str, etag: str | None = None) -> Dict[str, str]:
+    """Cabeçalhos HTTP usados ao baixar `url`."""
+
+    headers: Dict[str, str] = {}
+    # `.onnx` já é binário compactado: pedir gzip só gastaria CPU dos dois lados.
+    if url.endswith(".onnx"):
+        headers["Accept-Encoding"] = "identity"
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+def preallocate(fd: int, size: int) -> None:
+    """Reserva `size` bytes para o arquivo, evitando fragmentação."""
+
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError as exc:  # tmpfs, APFS e afins não suportam fallocate
+        logger.debug("posix_fallocate indisponível: %s", exc)
+
+
+def download_ranges(url: str, destination: Path, size: int) -> None:
+    """Baixa `url` em RANGE_PARTS requisições `Range` paralelas."""
+
+    part_size = -(-size // RANGE_PARTS)
+    ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    preallocate(fd, size)
+
+    def fetch_range(start: int, end: int) -> None:
+        headers = request_headers(url)
+        headers["Range"] = f"bytes={start}-{end}"
+        offset = start
+        with SESSION.get(url, stream=True, timeout=120, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise ValueError("servidor ignorou o cabeçalho Range")
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+        if offset != end + 1:
+            raise ValueError(f"parte {start}-{end} incompleta")
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fetch_range, start, end) for start, end in ranges]
+            for future in futures:
+                future.result()
+    finally:
+        os.close(fd)
+
+
+def download_file(
+    url: str, destination: Path, etag: str | None = None, size: int | None = None
+) -> Download:
+    """Efetua download via streaming e retorna o MD5 do conteúdo gravado.
+
+    O hash é calculado durante a escrita, dispensando uma segunda leitura do
+    arquivo para verificação. Com `etag`, a requisição é condicional e uma
+    resposta 304 não toca em `destination`. Arquivos cujo `size` (informado
+    pelo catálogo) passa de RANGE_THRESHOLD são divididos em partes paralelas
+    quando o servidor aceita `Range`; nesse modo o MD5 é calculado ao final.
+    """
 
     logger.info("⬇️  %s", url)
-    with requests.get(url, stream=True, timeout=120) as response:
+    if size and size >= RANGE_THRESHOLD and hasattr(os, "pwrite"):
+        head = SESSION.head(url, allow_redirects=True, timeout=30, headers=request_headers(url))
+        head.raise_for_status()
+        remote_etag = head.headers.get("ETag")
+        if etag and remote_etag == etag:
+            return Download(md5=None, etag=etag, not_modified=True)
+
+        remote_size = int(head.headers.get("Content-Length", 0))
+        if head.headers.get("Accept-Ranges") == "bytes" and remote_size >= RANGE_THRESHOLD:
+            # Usa a URL final (CDN) para não repetir o redirecionamento por parte.
+            download_ranges(head.url, destination, remote_size)
+            return Download(md5=compute_md5(destination), etag=remote_etag)
+
+    headers = request_headers(url, etag)
+    with SESSION.get(url, stream=True, timeout=120, headers=headers) as response:
+        if response.status_code == 304:
+            return Download(md5=None, etag=etag, not_modified=True)
         response.raise_for_status()
         destination.parent.mkdir(parents=True, exist_ok=True)
-        with destination.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=1 << 20):
-                if chunk:
-                    handle.write(chunk)
+        fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        # Com Content-Encoding o tamanho anunciado não é o do arquivo final.
+        if "Content-Encoding" not in response.headers:
+            preallocate(fd, int(response.headers.get("Content-Length", 0)))
+        with os.fdopen(fd, "wb") as handle:
+            writer = HashingWriter(handle)
+            # Copia em C direto do socket; `decode_content` mantém o
+            # tratamento de gzip que `iter_content` fazia.
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, writer, length=1 << 20)
+            # Descarta qualquer sobra reservada caso a transferência seja menor.
+            handle.truncate()
+    return Download(md5=writer.hexdigest(), etag=response.headers.get("ETag"))
+
+
+def cache_path(url: str) -> Path:
+    """Caminho no cache local (estilo HuggingFace) para uma URL."""
+
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return CACHE_DIR / digest[:2] / digest
+
 
+def link_from_cache(cached: Path, destination: Path) -> None:
+    """Expõe o arquivo em cache no destino via hardlink (ou cópia)."""
 
-def download_voice(voice: Voice, args: argparse.Namespace) -> bool:
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(cached, destination)
+    except OSError:
+        # Sistemas de arquivos distintos ou sem suporte a hardlink.
+        shutil.copy2(cached, destination)
+
+
+def cached_etag(cached: Path) -> str | None:
+    """ETag salvo junto ao arquivo em cache, se houver."""
+
+    etag_file = cached.with_name(cached.name + ".etag")
+    if cached.exists() and etag_file.exists():
+        return etag_file.read_text(encoding="utf-8").strip() or None
+    return None
+
+
+def cache_matches(cached: Path, expected_md5: str | None) -> bool:
+    """Confere o arquivo em cache contra o MD5 do catálogo.
+
+    Necessário mesmo com 304: o destino é um hardlink para o mesmo inode, e
+    uma edição local do destino corrompe também o cache.
+    """
+
+    return not expected_md5 or compute_md5(cached) == expected_md5
+
+
+def drop_cached_etag(cached: Path) -> None:
+    """Descarta o ETag salvo, forçando a próxima requisição a ser completa."""
+
+    cached.with_name(cached.name + ".etag").unlink(missing_ok=True)
+
+
+def store_in_cache(partial: Path, cached: Path, result: Download, expected_md5: str | None) -> None:
+    """Valida o download parcial e o promove ao cache junto com o ETag."""
+
+    if expected_md5 and result.md5 != expected_md5:
+        raise ValueError(f"hash MD5 não confere ({result.md5} != {expected_md5})")
+
+    os.replace(partial, cached)
+    etag_file = cached.with_name(cached.name + ".etag")
+    if result.etag:
+        etag_file.write_text(result.etag, encoding="utf-8")
+    else:
+        etag_file.unlink(missing_ok=True)
+
+
+def fetch_cached(url: str, expected_md5: str | None, size: int | None = None) -> Path:
+    """Garante `url` no cache local, revalidando pelo ETag salvo.
+
+    Retorna o caminho do arquivo em cache. Só há transferência de conteúdo
+    quando o servidor indica que o arquivo remoto mudou.
+    """
+
+    cached = cache_path(url)
+    partial = cached.with_name(cached.name + ".part")
+    try:
+        result = download_file(url, partial, etag=cached_etag(cached), size=size)
+        if result.not_modified and not cache_matches(cached, expected_md5):
+            logger.warning("⚠️ Cache corrompido, baixando novamente: %s", url)
+            drop_cached_etag(cached)
+            result = download_file(url, partial, size=size)
+        if result.not_modified:
+            logger.info("♻️  Sem alterações no servidor, usando cache: %s", url)
+        else:
+            store_in_cache(partial, cached, result, expected_md5)
+    finally:
+        partial.unlink(missing_ok=True)
+    return cached
+
+
+async def fetch_cached_async(
+    session: "aiohttp.ClientSession", url: str, expected_md5: str | None
+) -> Path:
+    """Equivalente assíncrono de `fetch_cached`, usando `aiohttp`."""
+
+    logger.info("⬇️  %s", url)
+    cached = cache_path(url)
+    partial = cached.with_name(cached.name + ".part")
+    etag = cached_etag(cached)
+    try:
+        while True:
+            async with session.get(url, headers=request_headers(url, etag)) as response:
+                if response.status == 304:
+                    # MD5 de um modelo inteiro: fora do event loop
+                    if await asyncio.to_thread(cache_matches, cached, expected_md5):
+                        logger.info("♻️  Sem alterações no servidor, usando cache: %s", url)
+                        return cached
+                    logger.warning("⚠️ Cache corrompido, baixando novamente: %s", url)
+                    drop_cached_etag(cached)
+                    etag = None
+                    continue
+                response.raise_for_status()
+
+                partial.parent.mkdir(parents=True, exist_ok=True)
+                md5 = hashlib.md5()
+                with partial.open("wb") as handle:
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        md5.update(chunk)
+                        handle.write(chunk)
+                result = Download(md5=md5.hexdigest(), etag=response.headers.get("ETag"))
+            break
+
+        store_in_cache(partial, cached, result, expected_md5)
+    finally:
+        partial.unlink(missing_ok=True)
+    return cached
+
+
+def snapshot_local_files(voices: Iterable[Voice]) -> LocalFiles:
+    """Levanta, com `os.scandir`, os arquivos locais das vozes selecionadas.
+
+    Um único `scandir` por diretório de voz já presente substitui os `stat`
+    individuais de cada arquivo durante o download.
+    """
+
+    root = Path("trained_models")
+    slugs = {voice.short_slug for voice in voices}
+    snapshot: LocalFiles = {}
+    try:
+        with os.scandir(root) as voice_dirs:
+            for voice_dir in voice_dirs:
+                if voice_dir.name not in slugs or not voice_dir.is_dir():
+                    continue
+                with os.scandir(voice_dir.path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            snapshot[root / voice_dir.name / entry.name] = entry.stat()
+    except FileNotFoundError:
+        pass
+    return snapshot
+
+
+def meta_md5(meta: Dict[str, str]) -> str | None:
+    """MD5 informado pelo catálogo para um arquivo."""
+
+    return meta.get("md5_digest") if isinstance(meta, dict) else None
+
+
+def meta_size(meta: Dict[str, str]) -> int:
+    """Tamanho em bytes informado pelo catálogo (0 quando ausente)."""
+
+    return int(meta.get("size_bytes") or 0) if isinstance(meta, dict) else 0
+
+
+def needs_download(
+    dest_file: Path, meta: Dict[str, str], args: argparse.Namespace, existing: LocalFiles
+) -> bool:
+    """Decide se o arquivo local precisa ser (re)baixado."""
+
+    stat = existing.get(dest_file)
+    if stat is None:
+        return True
+
+    if args.skip_existing:
+        logger.info("⏭️  Ignorando existente: %s", dest_file)
+        return False
+
+    # Tamanho divergente já reprova o arquivo, sem precisar calcular o hash.
+    expected_size = meta_size(meta)
+    if expected_size and stat.st_size != expected_size:
+        logger.info("🔁 Tamanho divergente, baixando novamente: %s", dest_file)
+        return True
+
+    if file_matches_md5(dest_file, meta_md5(meta)):
+        logger.info("✅ Já baixado: %s", dest_file)
+        return False
+    return True
+
+
+def download_voice_file(
+    rel_path: str,
+    dest_file: Path,
+    meta: Dict[str, str],
+    args: argparse.Namespace,
+    existing: LocalFiles,
+) -> bool:
+    """Baixa (ou reaproveita) um único arquivo de uma voz."""
+
+    url = HF_BASE_RESOLVE + rel_path
+    if not needs_download(dest_file, meta, args, existing):
+        return True
+
+    try:
+        link_from_cache(fetch_cached(url, meta_md5(meta), meta_size(meta)), dest_file)
+        logger.info("✅ Arquivo salvo em %s", dest_file)
+        return True
+    except Exception as exc:  # pragma: no cover - download externo
+        logger.error("❌ Falha ao baixar %s: %s", url, exc)
+        if dest_file.exists():
+            dest_file.unlink(missing_ok=True)
+        return False
+
+
+async def download_voice_file_async(
+    session: "aiohttp.ClientSession",
+    semaphore: asyncio.Semaphore,
+    rel_path: str,
+    dest_file: Path,
+    meta: Dict[str, str],
+    args: argparse.Namespace,
+    existing: LocalFiles,
+) -> bool:
+    """Versão assíncrona de `download_voice_file`."""
+
+    url = HF_BASE_RESOLVE + rel_path
+    # A verificação local pode calcular MD5 de arquivos grandes: fora do loop.
+    if not await asyncio.to_thread(needs_download, dest_file, meta, args, existing):
+        return True
+
+    try:
+        async with semaphore:
+            cached = await fetch_cached_async(session, url, meta_md5(meta))
+        link_from_cache(cached, dest_file)
+        logger.info("✅ Arquivo salvo em %s", dest_file)
+        return True
+    except Exception as exc:  # pragma: no cover - download externo
+        logger.error("❌ Falha ao baixar %s: %s", url, exc)
+        if dest_file.exists():
+            dest_file.unlink(missing_ok=True)
+        return False
+
+
+def download_voice(voice: Voice, args: argparse.Namespace, existing: LocalFiles) -> bool:
     """Baixa arquivos necessários de uma voz."""
 
     logger.info("\n📥 Voz: %s (%s | %s)", voice.key, voice.language_code, voice.quality)
-    success = True
+    entries = list(iter_voice_files(voice))
+    if not entries:
+        return True
 
-    for rel_path, dest_file, meta in iter_voice_files(voice):
-        url = HF_BASE_RESOLVE + rel_path
-        expected_md5 = meta.get("md5_digest") if isinstance(meta, dict) else None
+    voice.local_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+        futures = [
+            executor.submit(download_voice_file, rel_path, dest_file, meta, args, existing)
+            for rel_path, dest_file, meta in entries
+        ]
+        results = [future.result() for future in futures]
 
-        if dest_file.exists():
-            if args.skip_existing:
-                logger.info("⏭️  Ignorando existente: %s", dest_file)
-                continue
-            if file_matches_md5(dest_file, expected_md5):
-                logger.info("✅ Já baixado: %s", dest_file)
-                continue
-
-        try:
-            download_file(url, dest_file)
-            if expected_md5 and not file_matches_md5(dest_file, expected_md5):
-                raise ValueError("hash MD5 não confere")
-            logger.info("✅ Arquivo salvo em %s", dest_file)
-        except Exception as exc:  # pragma: no cover - download externo
-            logger.error("❌ Falha ao baixar %s: %s", url, exc)
-            success = False
-            if dest_file.exists():
-                dest_file.unlink(missing_ok=True)
-
-    return success
+    return all(results)
+
+
+def download_selected(
+    selected: list[Voice], args: argparse.Namespace, existing: LocalFiles
+) -> list[Voice]:
+    """Baixa as vozes selecionadas com um pool de threads."""
+
+    downloaded: list[Voice] = []
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(download_voice, voice, args, existing): voice for voice in selected
+        }
+        for future in as_completed(futures):
+            voice = futures[future]
+            try:
+                ok = future.result()
+            except Exception as exc:  # pragma: no cover - download externo
+                logger.error("❌ Falha inesperada em %s: %s", voice.key, exc)
+                ok = False
+            if ok:
+                downloaded.append(voice)
+    return downloaded
+
+
+async def download_selected_async(
+    selected: list[Voice], args: argparse.Namespace, existing: LocalFiles
+) -> list[Voice]:
+    """Baixa as vozes selecionadas em um único event loop com `aiohttp`."""
+
+    # Mesmo limite de transferências simultâneas do modo com threads.
+    limit = max(1, args.workers) * 2
+    semaphore = asyncio.Semaphore(limit)
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=120)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+        async def download_one(voice: Voice) -> bool:
+            logger.info("\n📥 Voz: %s (%s | %s)", voice.key, voice.language_code, voice.quality)
+            entries = list(iter_voice_files(voice))
+            if entries:
+                voice.local_dir.mkdir(parents=True, exist_ok=True)
+            results = await asyncio.gather(
+                *(
+                    download_voice_file_async(
+                        session, semaphore, rel_path, dest_file, meta, args, existing
+                    )
+                    for rel_path, dest_file, meta in entries
+                )
+            )
+            return all(results)
+
+        results = await asyncio.gather(*(download_one(voice) for voice in selected))
+
+    return [voice for voice, ok in zip(selected, results) if ok]
 
 
 def download_catalog(args: argparse.Namespace) -> list[Voice]:
     """Baixa vozes conforme filtros configured."""
 
     catalog = fetch_catalog()
-    selected = [voice for voice in catalog.values() if should_include(voice, args)]
+    matches = build_filter(args)
+    selected = [voice for voice in catalog.values() if matches(voice)]
 
     if not selected:
         logger.warning("Nenhuma voz corresponde aos filtros informados.")
@@ -185,11 +752,19 @@ def download_catalog(args: argparse.Namespace) -> list[Voice]:
 
     logger.info("🎯 %s vozes selecionadas para download", len(selected))
 
-    downloaded: list[Voice] = []
-    for voice in selected:
-        if download_voice(voice, args):
-            downloaded.append(voice)
+    existing = snapshot_local_files(selected)
+    # O motor com threads é o padrão: só ele tem a política de Retry, o
+    # download em faixas (Range) e a pré-alocação do arquivo
+    if args.async_engine and aiohttp is None:
+        logger.warning("⚠️ aiohttp não instalado, usando o motor com threads")
+    if args.async_engine and aiohttp is not None:
+        downloaded = asyncio.run(download_selected_async(selected, args, existing))
+    else:
+        downloaded = download_selected(selected, args, existing)
 
+    # Mantém a ordem do catálogo no relatório final.
+    order = {voice.key: index for index, voice in enumerate(selected)}
+    downloaded.sort(key=lambda voice: order[voice.key])
     return downloaded
 
 
@@ -220,6 +795,18 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Não sobrescreve arquivos já presentes com hash válido.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Número de vozes baixadas em paralelo (padrão: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_engine",
+        action="store_true",
+        help="Usa o motor assíncrono com aiohttp (sem Retry, faixas Range nem pré-alocação).",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -233,6 +820,7 @@ def main(argv: Iterable[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.INFO))
+    configure_session(args.workers)
 
     try:
         downloaded = download_catalog(args)
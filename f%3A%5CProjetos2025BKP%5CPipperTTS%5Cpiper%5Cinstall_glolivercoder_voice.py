@@ -4,20 +4,63 @@ Script para migrar para o repositório glolivercoder/PipperTTS_Voice_Developer
 """
 
 import os
+import shlex
 import subprocess
 import sys
 import shutil
+import threading
 
 def run_command(cmd, cwd=None):
-    """Executa um comando e retorna o resultado"""
+    """Executa um comando exibindo a saída em tempo real"""
     print(f"Executando: {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Erro: {result.stderr}")
+    proc = subprocess.Popen(
+        shlex.split(cmd),
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    if proc.wait() != 0:
+        print(f"Erro: comando terminou com código {proc.returncode}")
         return False
-    print(result.stdout)
     return True
 
+def git_clone_flags():
+    """Flags de clone raso/parcial suportadas pelo git instalado"""
+    # --progress: com a saída em pipe o git omite o progresso do clone
+    flags = "--progress --depth=1 --single-branch -c feature.manyFiles=true"
+    try:
+        output = subprocess.run(
+            ["git", "--version"], capture_output=True, text=True, check=True
+        ).stdout
+        version = tuple(int(part) for part in output.split()[2].split(".")[:2])
+    except (OSError, subprocess.CalledProcessError, IndexError, ValueError):
+        return flags
+    # Clone parcial (--filter) exige git 2.19+
+    if version >= (2, 19):
+        flags += " --filter=blob:none"
+    return flags
+
+def move_path(src, dst):
+    """Move `src` para `dst`, com rename O(1) quando no mesmo sistema de arquivos"""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(src, dst)
+
+def remove_tree_async(path):
+    """Renomeia o diretório e remove o conteúdo em segundo plano"""
+    trash = f"{path}.trash-{os.getpid()}"
+    os.rename(path, trash)
+    # Thread não-daemon: o interpretador aguarda a remoção antes de sair,
+    # mas o clone já pode começar enquanto ela acontece.
+    worker = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True})
+    worker.start()
+    return worker
+
 def main():
     """Função principal de migração"""
     print("🔄 Migrando para glolivercoder/PipperTTS_Voice_Developer...")
@@ -25,16 +68,16 @@ def main():
     # Verificar se existe o diretório piper antigo
     if os.path.exists("piper_old_fork"):
         print("⚠️  Diretório piper_old_fork já existe. Removendo...")
-        shutil.rmtree("piper_old_fork")
+        remove_tree_async("piper_old_fork")
     
     # Fazer backup do repositório antigo
     if os.path.exists("src/piper_new"):
         print("📦 Fazendo backup do repositório antigo...")
-        shutil.move("src/piper_new", "piper_old_fork")
+        move_path("src/piper_new", "piper_old_fork")
     
     # Clonar o novo repositório
     print("📥 Clonando glolivercoder/PipperTTS_Voice_Developer...")
-    if not run_command("git clone https://github.com/glolivercoder/PipperTTS_Voice_Developer.git"):
+    if not run_command(f"git clone {git_clone_flags()} https://github.com/glolivercoder/PipperTTS_Voice_Developer.git"):
         print("❌ Falha ao clonar o repositório")
         return False
     
@@ -2,20 +2,189 @@
 """
 Sistema de inferência para modelos Piper TTS treinados
 """
+import asyncio
+import hashlib
+import os
 import torch
 import onnxruntime as ort
 import numpy as np
 import json
 import gruut
 import soundfile as sf
+import threading
+from array import array
+from collections import OrderedDict
 from pathlib import Path
-import librosa
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+# Quantização int8 (gerada offline com `python piper_inference_fixed.py --quantize`)
+from piper_inference_fixed import quantized_model_path
+
+# Execution providers em ordem de preferência (os indisponíveis são ignorados)
+PREFERRED_PROVIDERS = [
+    'CUDAExecutionProvider',
+    'DmlExecutionProvider',
+    'CoreMLExecutionProvider',
+    'CPUExecutionProvider',
+]
+
+# Fonemas IPA sem correspondência no mapa -> fonema similar mais comum
+SIMILAR_PHONEMES = {
+    'ɑ': 'a', 'ɒ': 'a', 'ʌ': 'a', 'ə': 'a',
+    'ɛ': 'e', 'ɜ': 'e', 'ɪ': 'i', 'ɨ': 'i',
+    'ɔ': 'o', 'ɵ': 'o', 'ʊ': 'u', 'ʉ': 'u',
+    'ɹ': 'r', 'ɾ': 'r', 'ʔ': 't', 'θ': 't',
+    'ð': 'd', 'ʒ': 'z', 'ʃ': 's', 'ç': 'h'
+}
+
+# Papel de cada entrada conhecida do modelo ONNX do Piper
+ONNX_INPUT_ROLES = {'input': 'phoneme', 'input_lengths': 'length', 'scales': 'scales'}
+
+# Maior sequência de fonemas atendida pelos buffers fixos do IOBinding
+IO_BINDING_MAX_PHONEMES = 512
+
+# Amplitude abaixo da qual o final de um item do lote é tratado como padding
+BATCH_PADDING_THRESHOLD = 1e-4
+
+# Tamanho máximo (em fonemas) de cada trecho entregue por synthesize_stream
+STREAM_CHUNK_PHONEMES = 128
+
+# Número máximo de textos mantidos no cache de fonemas de cada instância
+PHONEME_CACHE_SIZE = 1024
+
+def session_thread_count() -> int:
+    """Threads intra-op de cada sessão ONNX
+    
+    Padrão: metade dos núcleos. Processos que hospedam várias vozes devem
+    definir PIPER_ORT_THREADS (ex.: núcleos / número de vozes, ou 1) para que
+    as sessões somadas não ultrapassem a CPU.
+    """
+    configured = os.environ.get('PIPER_ORT_THREADS')
+    if configured:
+        return max(1, int(configured))
+    return max(1, (os.cpu_count() or 2) // 2)
+
+def create_session_options() -> ort.SessionOptions:
+    """Opções de sessão ONNX com otimização de grafo e threads limitadas
+    
+    O ONNX Runtime em Python não expõe o thread pool global, então cada
+    sessão tem o seu. Para várias sessões no mesmo processo conviverem, o
+    spin-wait fica desligado (threads ociosas dormem em vez de ocupar núcleos
+    que outra voz está usando) e o tamanho do pool vem de session_thread_count.
+    """
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = session_thread_count()
+    options.inter_op_num_threads = 1
+    options.add_session_config_entry('session.intra_op.allow_spinning', '0')
+    options.add_session_config_entry('session.inter_op.allow_spinning', '0')
+    return options
+
+def select_providers() -> List[str]:
+    """Seleciona os execution providers disponíveis, em ordem de preferência"""
+    available = set(ort.get_available_providers())
+    return [provider for provider in PREFERRED_PROVIDERS if provider in available]
+
+def optimized_model_path(model_path, provider: str = 'CPUExecutionProvider') -> Path:
+    """Caminho do grafo já otimizado pelo ONNX Runtime
+    
+    O arquivo só vale para o provider e a versão do ONNX Runtime que o
+    geraram, então ambos entram no nome (`modelo.cpu-ort1.17.1.opt.onnx`).
+    """
+    tag = provider.replace('ExecutionProvider', '').lower()
+    return Path(model_path).with_suffix(f'.{tag}-ort{ort.__version__}.opt.onnx')
+
+def create_session(model_path) -> ort.InferenceSession:
+    """Cria uma sessão ONNX com as opções e providers padrão do projeto
+    
+    Na primeira carga o grafo otimizado (fusões, constant folding) é gravado
+    em `modelo.<provider>-ort<versão>.opt.onnx`; nas seguintes ele é lido
+    direto, sem repetir as otimizações. Se o modelo original mudar, o
+    arquivo é regenerado.
+    """
+    options = create_session_options()
+    providers = select_providers()
+    source = Path(model_path)
+    optimized = optimized_model_path(source, providers[0] if providers else 'CPUExecutionProvider')
+    
+    if optimized.exists() and optimized.stat().st_mtime >= source.stat().st_mtime:
+        # Fusões já aplicadas; só as otimizações de layout (dependentes da
+        # CPU, por isso nunca gravadas em disco) rodam de novo
+        source = optimized
+    elif os.access(optimized.parent, os.W_OK):
+        # ORT_ENABLE_ALL gravaria transformações de layout específicas do
+        # hardware; o arquivo salvo fica no nível EXTENDED
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        options.optimized_model_filepath = str(optimized)
+    
+    return ort.InferenceSession(
+        str(source),
+        sess_options=options,
+        providers=providers,
+    )
+
+def trim_trailing_silence(audio: np.ndarray, threshold: float = BATCH_PADDING_THRESHOLD) -> np.ndarray:
+    """Corta o silêncio final (padding de itens menores de um lote)"""
+    voiced = np.flatnonzero(np.abs(audio) > threshold)
+    return audio[:voiced[-1] + 1] if voiced.size else audio[:0]
+
+def trim_mel_padding(mel: np.ndarray) -> np.ndarray:
+    """Corta os quadros finais constantes (mascarados) de um mel em lote"""
+    varying = np.flatnonzero(np.ptp(mel, axis=0) > 0)
+    return mel[:, :varying[-1] + 1] if varying.size else mel
+
+def normalize_peak(audio: np.ndarray, peak: float = 1.0) -> np.ndarray:
+    """Normaliza o pico do áudio in-place (sem arrays temporários)"""
+    # max/min direto evita o array intermediário de np.abs(audio)
+    current = max(float(audio.max()), -float(audio.min())) if audio.size else 0.0
+    if current > 0:
+        np.multiply(audio, peak / current, out=audio)
+    return audio
+
+def clip_audio(audio: np.ndarray) -> np.ndarray:
+    """Limita o áudio a [-1, 1] in-place, com ganho fixo (sem normalizar)"""
+    return np.clip(audio, -1.0, 1.0, out=audio)
+
+class SynthesisCache:
+    """Cache LRU thread-safe de áudios sintetizados"""
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Gera a chave a partir de texto, voz e parâmetros de síntese"""
+        return hashlib.md5("|".join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: str, audio: np.ndarray, sample_rate: int):
+        with self._lock:
+            self._entries[key] = (audio.copy(), sample_rate)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
 
 class PiperTTSInference:
     """Sistema de inferência para modelos Piper TTS"""
     
-    def __init__(self, model_path: str, config_path: str):
+    # Compartilhado entre instâncias do processo; a chave inclui o modelo
+    synthesis_cache = SynthesisCache()
+    
+    def __init__(self, model_path: str, config_path: str, vocoder_path: Optional[str] = None):
         self.model_path = Path(model_path)
         self.config_path = Path(config_path)
         
@@ -23,9 +192,37 @@ class PiperTTSInference:
         with open(self.config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
         
+        # Vocoder neural opcional (ex: HiFi-GAN exportado com torch.onnx.export,
+        # eixo de tempo dinâmico). Procurado em `vocoder_path`, na chave
+        # "vocoder" da configuração ou como `<modelo>.vocoder.onnx`.
+        self.vocoder_session = self._load_vocoder(vocoder_path)
+        self._vocoder_input = self.vocoder_session.get_inputs()[0].name if self.vocoder_session else None
+        # Pseudo-inversas do banco mel usadas pelo Griffin-Lim, por (sr, n_mels)
+        self._mel_inverse_cache = {}
+        
+        # Cache LRU de fonemas por (texto, idioma): frases repetidas não
+        # passam de novo pelo gruut
+        self._phoneme_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._phoneme_cache_lock = threading.Lock()
+        
+        # Serializa session.run: em CPU, duas inferências simultâneas na mesma
+        # sessão disputam cache/núcleos e pioram a latência de ambas. Para
+        # paralelismo real use várias sessões, o que só compensa em GPU.
+        self._infer_lock = threading.Lock()
+        # Thread única para synthesize_async/synthesize_stream_async
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='piper-tts')
+        self._build_phoneme_tables()
+        
+        # Modelo int8 quando existir, salvo "quantize": false na configuração
+        onnx_path = self.model_path
+        if self.config.get('quantize', True) and quantized_model_path(self.model_path).exists():
+            onnx_path = quantized_model_path(self.model_path)
+        
         # Inicializar sessão ONNX
         try:
-            self.session = ort.InferenceSession(str(self.model_path))
+            self.session = create_session(onnx_path)
+            self._cache_session_io()
+            self._setup_io_binding()
             self.onnx_available = True
         except Exception as e:
             print(f"⚠️  Erro carregando modelo ONNX: {e}")
@@ -33,205 +230,259 @@ class PiperTTSInference:
             
             # Fallback: carregar modelo PyTorch se disponível
             try:
-                from piper_train_real import SimpleVITS
-                self.model = SimpleVITS.load_from_checkpoint(str(self.model_path))
-                self.model.eval()
+                self.model = self._load_pytorch_model()
                 self.pytorch_available = True
             except:
                 self.pytorch_available = False
     
-    def text_to_phonemes(self, text: str, language: str = "pt") -> List[int]:
-        """Converte texto para sequência de IDs de fonemas"""
+    def _load_pytorch_model(self):
+        """Carrega o modelo PyTorch do fallback, já pronto para inferência
+        
+        Prefere um TorchScript congelado; senão usa o checkpoint do SimpleVITS,
+        compilado com torch.compile quando disponível. A inferência de
+        aquecimento paga aqui o custo de compilação, e não na primeira síntese.
+        """
+        try:
+            model = torch.jit.freeze(torch.jit.load(str(self.model_path), map_location='cpu').eval())
+        except Exception:
+            from piper_train_real import SimpleVITS
+            model = SimpleVITS.load_from_checkpoint(str(self.model_path))
+            model.eval()
+            if hasattr(torch, 'compile'):
+                compiled = torch.compile(model, mode='reduce-overhead', fullgraph=False)
+                if self._warm_up(compiled):
+                    return compiled
+        
+        self._warm_up(model)
+        return model
+    
+    def _warm_up(self, model) -> bool:
+        """Executa uma inferência curta (BOS, 'a', EOS) para aquecer o modelo"""
+        dummy = torch.tensor([[self._bos_id, self._a_id, self._eos_id]], dtype=torch.long)
+        try:
+            with torch.inference_mode():
+                model(dummy)
+            return True
+        except Exception as e:
+            print(f"⚠️  Aquecimento do modelo PyTorch falhou: {e}")
+            return False
+    
+    def text_to_phonemes(self, text: str, language: str = "pt") -> np.ndarray:
+        """Converte texto para IDs de fonemas (int64, somente leitura, com cache LRU)"""
+        return self._phonemes(text, language)[0]
+    
+    def _phonemes(self, text: str, language: str) -> Tuple[np.ndarray, bool]:
+        """IDs de fonemas e se vieram do fallback (que nunca entra no cache)"""
+        key = (text, language)
+        with self._phoneme_cache_lock:
+            cached = self._phoneme_cache.get(key)
+            if cached is not None:
+                self._phoneme_cache.move_to_end(key)
+                return cached, False
+        
+        phonemes, fallback = self._text_to_phonemes_uncached(text, language)
+        phonemes = np.asarray(phonemes, dtype=np.int64)
+        # O mesmo array é devolvido a cada acerto do cache: impedir alterações
+        phonemes.flags.writeable = False
+        
+        if not fallback:
+            with self._phoneme_cache_lock:
+                self._phoneme_cache[key] = phonemes
+                if len(self._phoneme_cache) > PHONEME_CACHE_SIZE:
+                    self._phoneme_cache.popitem(last=False)
+        return phonemes, fallback
+    
+    def cache_clear(self):
+        """Esvazia o cache de fonemas (útil em servidores de longa duração)"""
+        with self._phoneme_cache_lock:
+            self._phoneme_cache.clear()
+    
+    def _build_phoneme_tables(self):
+        """Pré-calcula as tabelas de IDs usadas a cada conversão de fonemas"""
+        phoneme_id_map = self.config.get('phoneme_id_map', {})
+        
+        self._pid = {phoneme: ids[0] for phoneme, ids in phoneme_id_map.items() if ids}
+        self._bos_id = self._pid.get('_', 1)
+        self._eos_id = self._pid.get('$', 2)
+        self._space_id = self._pid.get(' ', 3)
+        self._a_id = self._pid.get('a', 14)
+        self._max_id = max(map(max, filter(None, phoneme_id_map.values())), default=200)
+        self._similar_id = {
+            source: self._pid[target]
+            for source, target in SIMILAR_PHONEMES.items()
+            if target in self._pid
+        }
+    
+    def _text_to_phonemes_uncached(self, text: str, language: str) -> Tuple[np.ndarray, bool]:
+        """Converte texto para sequência de IDs de fonemas
+        
+        Retorna também se a sequência é o padrão de fallback (sem gruut/mapa).
+        """
         try:
-            # Obter mapa de fonemas do modelo
-            phoneme_id_map = self.config.get('phoneme_id_map', {})
-            
             # Se não houver mapa, usar método de fallback
-            if not phoneme_id_map:
+            if not self._pid:
                 print("⚠️  Mapa de fonemas não encontrado, usando síntese sintética")
-                return self._generate_fallback_phonemes(text)
+                return self._generate_fallback_phonemes(text), True
             
-            # Usar gruut para fonemas
-            phonemes = []
+            pid = self._pid
+            similar_id = self._similar_id
+            a_id = self._a_id
+            space_id = self._space_id
             
-            # Adicionar token de início (BOS)
-            bos_id = phoneme_id_map.get('_', [1])[0] if '_' in phoneme_id_map else 1
-            phonemes.append(bos_id)
+            # Usar gruut para fonemas, começando pelo token de início (BOS).
+            # array('q') guarda int64 nativos: vira ndarray sem cópia no final
+            phonemes = array('q', [self._bos_id])
             
             for sentence in gruut.sentences(text, lang=language):
                 for word in sentence:
                     if word.phonemes:
-                        for phoneme in word.phonemes:
-                            # Procurar fonema no mapa
-                            if phoneme in phoneme_id_map:
-                                phoneme_id = phoneme_id_map[phoneme][0]
-                                phonemes.append(phoneme_id)
-                            else:
-                                # Fonema não encontrado, tentar fonemas similares
-                                phoneme_id = self._find_similar_phoneme(phoneme, phoneme_id_map)
-                                phonemes.append(phoneme_id)
+                        # Fonema ausente do mapa: similar conhecido ou vogal 'a'
+                        phonemes.extend(
+                            pid.get(phoneme, similar_id.get(phoneme, a_id))
+                            for phoneme in word.phonemes
+                        )
                     else:
-                        # Palavra sem fonemas, usar caracteres
-                        for char in word.text.lower():
-                            if char in phoneme_id_map:
-                                phonemes.append(phoneme_id_map[char][0])
-                            else:
-                                # Caractere não encontrado, usar espaço ou vogal
-                                if char.isspace():
-                                    space_id = phoneme_id_map.get(' ', [3])[0] if ' ' in phoneme_id_map else 3
-                                    phonemes.append(space_id)
-                                else:
-                                    # Usar vogal 'a' como fallback
-                                    a_id = phoneme_id_map.get('a', [14])[0] if 'a' in phoneme_id_map else 14
-                                    phonemes.append(a_id)
+                        # Palavra sem fonemas, usar caracteres (espaço ou vogal 'a'
+                        # quando o caractere não está no mapa)
+                        phonemes.extend(
+                            pid.get(char, space_id if char.isspace() else a_id)
+                            for char in word.text.lower()
+                        )
                     
                     # Adicionar espaço entre palavras
-                    space_id = phoneme_id_map.get(' ', [3])[0] if ' ' in phoneme_id_map else 3
                     phonemes.append(space_id)
             
             # Adicionar token de fim (EOS)
-            eos_id = phoneme_id_map.get('$', [2])[0] if '$' in phoneme_id_map else 2
-            phonemes.append(eos_id)
+            phonemes.append(self._eos_id)
             
-            # Garantir que todos os IDs estão dentro dos limites
-            max_allowed_id = max(max(ids) for ids in phoneme_id_map.values()) if phoneme_id_map else 200
-            phonemes = [min(id_val, max_allowed_id) for id_val in phonemes]
-            
-            return phonemes
+            # Garantir que todos os IDs estão dentro dos limites (in-place)
+            ids = np.frombuffer(phonemes, dtype=np.int64)
+            np.minimum(ids, self._max_id, out=ids)
+            return ids, False
             
         except Exception as e:
             print(f"⚠️  Erro na conversão de fonemas: {e}")
-            return self._generate_fallback_phonemes(text)
-    
-    def _find_similar_phoneme(self, phoneme: str, phoneme_id_map: dict) -> int:
-        """Encontra um fonema similar quando o original não existe no mapa"""
-        # Mapeamento de fonemas similares
-        similar_map = {
-            'ɑ': 'a', 'ɒ': 'a', 'ʌ': 'a', 'ə': 'a',
-            'ɛ': 'e', 'ɜ': 'e', 'ɪ': 'i', 'ɨ': 'i',
-            'ɔ': 'o', 'ɵ': 'o', 'ʊ': 'u', 'ʉ': 'u',
-            'ɹ': 'r', 'ɾ': 'r', 'ʔ': 't', 'θ': 't',
-            'ð': 'd', 'ʒ': 'z', 'ʃ': 's', 'ç': 'h'
-        }
-        
-        # Tentar encontrar fonema similar
-        if phoneme in similar_map:
-            similar = similar_map[phoneme]
-            if similar in phoneme_id_map:
-                return phoneme_id_map[similar][0]
-        
-        # Fallback: usar vogal 'a'
-        return phoneme_id_map.get('a', [14])[0] if 'a' in phoneme_id_map else 14
+            return self._generate_fallback_phonemes(text), True
     
-    def _generate_fallback_phonemes(self, text: str) -> List[int]:
+    def _generate_fallback_phonemes(self, text: str) -> np.ndarray:
         """Gera sequência de fonemas de fallback quando o método principal falha"""
         # Usar sequência simples baseada no comprimento do texto
         length = min(len(text), 50)  # Limitar tamanho
-        phonemes = [1]  # BOS
         
-        # Adicionar padrão simples alternando vogais e consoantes
-        vowels = [14, 18, 21, 27, 33]  # a, e, i, o, u
-        consonants = [15, 17, 19, 20, 23, 24, 25, 26, 28, 29, 30, 31, 32, 34, 35, 36, 37, 38]  # b, d, f, h, k, l, m, n, p, q, r, s, t, v, w, x, y, z
+        # Padrão simples alternando vogais e consoantes
+        vowels = np.array([14, 18, 21, 27, 33], dtype=np.int64)  # a, e, i, o, u
+        consonants = np.array([15, 17, 19, 20, 23, 24, 25, 26, 28, 29, 30, 31, 32, 34, 35, 36, 37, 38], dtype=np.int64)  # b, d, f, h, k, l, m, n, p, q, r, s, t, v, w, x, y, z
         
-        for i in range(length):
-            if i % 2 == 0:
-                phonemes.append(vowels[i % len(vowels)])
-            else:
-                phonemes.append(consonants[i % len(consonants)])
-            
-            if i % 4 == 3:  # Adicionar espaço a cada 4 fonemas
-                phonemes.append(3)
+        idx = np.arange(length)
+        ids = np.where(idx % 2 == 0, vowels[idx % len(vowels)], consonants[idx % len(consonants)])
+        
+        # Espaço (3) depois de cada grupo de 4 fonemas
+        ids = np.insert(ids, np.flatnonzero(idx % 4 == 3) + 1, 3)
         
-        phonemes.append(2)  # EOS
-        return phonemes
+        return np.concatenate(([1], ids, [2]))  # BOS ... EOS
+    
+    def _load_vocoder(self, vocoder_path: Optional[str]) -> Optional[ort.InferenceSession]:
+        """Carrega o vocoder neural ONNX, se houver um disponível"""
+        candidates = [vocoder_path, self.config.get('vocoder'), f"{self.model_path.with_suffix('')}.vocoder.onnx"]
+        for candidate in candidates:
+            if candidate and Path(candidate).exists():
+                try:
+                    return create_session(candidate)
+                except Exception as e:
+                    print(f"⚠️  Erro carregando vocoder ONNX: {e}")
+        return None
     
-    def mel_to_audio(self, mel_spectrogram: np.ndarray, sample_rate: int = 22050) -> np.ndarray:
-        """Converte mel-spectrogram para áudio usando Griffin-Lim"""
+    def mel_to_audio(
+        self, mel_spectrogram: np.ndarray, sample_rate: int = 22050, normalize: bool = True
+    ) -> np.ndarray:
+        """Converte mel-spectrogram para áudio (vocoder neural ou Griffin-Lim)
         
-        # Converter mel para linear spectrogram (aproximação)
-        mel_db = mel_spectrogram
-        mel_linear = librosa.db_to_power(mel_db)
+        Com `normalize=False` o áudio do Griffin-Lim sai sem normalização de
+        pico (usado no streaming, em que todos os trechos têm o mesmo ganho).
+        """
         
-        # Usar Griffin-Lim para reconstruir áudio
-        audio = librosa.feature.inverse.mel_to_audio(
-            mel_linear,
-            sr=sample_rate,
-            n_fft=1024,
+        if self.vocoder_session is not None:
+            mel = mel_spectrogram.astype(np.float32)[np.newaxis, :, :]
+            with self._infer_lock:
+                audio = self.vocoder_session.run(None, {self._vocoder_input: mel})[0]
+            return np.asarray(audio, dtype=np.float32).reshape(-1)
+        
+        # Fallback sem vocoder: Griffin-Lim (lento, importado só quando necessário)
+        import librosa
+        
+        # Mel em dB (valores <= 0) precisa voltar para potência; mel já em
+        # potência (estritamente positivo) segue direto
+        if mel_spectrogram.min() > 0:
+            mel_linear = mel_spectrogram
+        else:
+            mel_linear = librosa.db_to_power(mel_spectrogram)
+        
+        # Mel -> magnitude linear pela pseudo-inversa do banco mel (cacheada),
+        # em vez do NNLS que o librosa resolve a cada chamada
+        mel_inverse = self._mel_inverse(librosa, sample_rate, mel_linear.shape[0])
+        magnitude = np.sqrt(np.maximum(mel_inverse @ mel_linear, 0))
+        
+        # Fast Griffin-Lim (momentum 0.99): converge com metade das iterações
+        audio = librosa.griffinlim(
+            magnitude,
+            n_iter=16,
+            momentum=0.99,
             hop_length=256,
             win_length=1024,
-            n_iter=32
+            init='random'
         )
         
         # Normalizar
-        audio = librosa.util.normalize(audio)
-        
-        return audio
+        return normalize_peak(audio) if normalize else audio
+    
+    def _mel_inverse(self, librosa, sample_rate: int, n_mels: int) -> np.ndarray:
+        """Pseudo-inversa do banco de filtros mel, calculada uma vez por formato"""
+        key = (sample_rate, n_mels)
+        if key not in self._mel_inverse_cache:
+            mel_basis = librosa.filters.mel(sr=sample_rate, n_fft=1024, n_mels=n_mels)
+            self._mel_inverse_cache[key] = np.linalg.pinv(mel_basis)
+        return self._mel_inverse_cache[key]
     
     def synthesize(self, text: str, output_path: Optional[str] = None) -> np.ndarray:
         """Sintetiza áudio a partir de texto"""
         
         print(f"🎤 Sintetizando: '{text}'")
         
-        # Converter texto para fonemas
         language = self.config.get('language', 'pt')
-        phonemes = self.text_to_phonemes(text, language)
+        inference = self.config.get('inference', {})
+        cache_key = SynthesisCache.make_key(
+            self.model_path, text, language,
+            inference.get('noise_scale', 0.667),
+            inference.get('length_scale', 1.0),
+            inference.get('noise_w', 0.8),
+        )
+        cached = self.synthesis_cache.get(cache_key)
+        if cached is not None:
+            audio, sample_rate = cached
+            print(f"⚡ Áudio recuperado do cache: {len(audio)} amostras")
+            if output_path:
+                self._save_audio(output_path, audio, sample_rate)
+            return audio.copy()
         
-        print(f"📝 Fonemas: {len(phonemes)} tokens")
+        # Converter texto para fonemas
+        phonemes, fallback = self._encode(text)
         
-        # Preparar input
-        phoneme_input = np.array([phonemes], dtype=np.int64)
+        print(f"📝 Fonemas: {len(phonemes)} tokens")
         
         try:
-            if self.onnx_available:
-                # Usar modelo ONNX com parâmetros corretos
-                input_names = [inp.name for inp in self.session.get_inputs()]
-                output_names = [out.name for out in self.session.get_outputs()]
-                
-                # Preparar inputs baseado nos nomes esperados
-                inputs = {}
-                for input_name in input_names:
-                    if input_name == 'input':
-                        inputs[input_name] = phoneme_input
-                    elif input_name == 'input_lengths':
-                        inputs[input_name] = np.array([len(phonemes)], dtype=np.int64)
-                    elif input_name == 'scales':
-                        # Parâmetros de escala (noise_scale, length_scale, noise_w)
-                        noise_scale = self.config.get('inference', {}).get('noise_scale', 0.667)
-                        length_scale = self.config.get('inference', {}).get('length_scale', 1.0)
-                        noise_w = self.config.get('inference', {}).get('noise_w', 0.8)
-                        inputs[input_name] = np.array([noise_scale, length_scale, noise_w], dtype=np.float32)
-                    else:
-                        # Para outros inputs, usar valores padrão
-                        inputs[input_name] = np.zeros((1, 1), dtype=np.float32)
-                
-                result = self.session.run(output_names, inputs)
-                mel_output = result[0][0] if result else self.generate_synthetic_mel(len(phonemes))
-                
-            elif self.pytorch_available:
-                # Usar modelo PyTorch
-                with torch.no_grad():
-                    phoneme_tensor = torch.LongTensor(phoneme_input)
-                    mel_output = self.model(phoneme_tensor)
-                    mel_output = mel_output[0].numpy()  # [mel_bins, time]
-            
-            else:
-                # Fallback: gerar mel-spectrogram sintético
-                print("⚠️  Usando síntese sintética (modelo não disponível)")
-                mel_output = self.generate_synthetic_mel(len(phonemes))
-            
-            print(f"🎵 Mel-spectrogram gerado: {mel_output.shape}")
-            
-            # Converter mel para áudio
             sample_rate = self.config.get('audio', {}).get('sample_rate', 22050)
-            audio = self.mel_to_audio(mel_output, sample_rate)
+            audio, synthetic = self._decode_chunk(phonemes)
             
             print(f"🔊 Áudio gerado: {len(audio)} amostras, {len(audio)/sample_rate:.2f}s")
             
+            # Apenas síntese real entra no cache: fonemas de fallback, mel
+            # sintético e o áudio sintético abaixo nunca são guardados
+            if not (fallback or synthetic):
+                self.synthesis_cache.put(cache_key, audio, sample_rate)
+            
             # Salvar se especificado
             if output_path:
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                sf.write(output_path, audio, sample_rate)
-                print(f"💾 Áudio salvo em: {output_path}")
+                self._save_audio(output_path, audio, sample_rate)
             
             return audio
             
@@ -245,6 +496,219 @@ class PiperTTSInference:
                 print(f"💾 Áudio sintético salvo em: {output_path}")
             return audio
     
+    def _encode(self, text: str) -> Tuple[np.ndarray, bool]:
+        """Etapa leve da síntese: texto -> (IDs de fonemas, se é fallback)"""
+        return self._phonemes(text, self.config.get('language', 'pt'))
+    
+    def _decode_chunk(self, phonemes: np.ndarray, normalize: bool = True) -> Tuple[np.ndarray, bool]:
+        """Etapa pesada da síntese: IDs de fonemas -> (áudio, se é sintético)
+        
+        Recebe uma sequência completa (com BOS/EOS), seja a frase inteira ou
+        um trecho produzido por `_stream_segments`. Com `normalize=False` o
+        pico não é normalizado, para o chamador aplicar um ganho próprio.
+        """
+        synthetic = False
+        if self.onnx_available:
+            # Usar modelo ONNX com parâmetros corretos
+            result = self._run_onnx(phonemes)
+            if result and self._output_is_audio:
+                # O modelo já devolve áudio: dispensa vocoder/Griffin-Lim
+                audio = np.asarray(result[0], dtype=np.float32).reshape(-1)
+                return (normalize_peak(audio) if normalize else audio), False
+            synthetic = not result
+            mel_output = result[0][0] if result else self.generate_synthetic_mel(len(phonemes))
+            
+        elif self.pytorch_available:
+            # Usar modelo PyTorch
+            with torch.inference_mode():
+                phoneme_tensor = torch.LongTensor(phonemes[np.newaxis, :])
+                mel_output = self.model(phoneme_tensor)
+                mel_output = mel_output[0].numpy()  # [mel_bins, time]
+        
+        else:
+            # Fallback: gerar mel-spectrogram sintético
+            print("⚠️  Usando síntese sintética (modelo não disponível)")
+            synthetic = True
+            mel_output = self.generate_synthetic_mel(len(phonemes))
+        
+        print(f"🎵 Mel-spectrogram gerado: {mel_output.shape}")
+        
+        # Converter mel para áudio
+        sample_rate = self.config.get('audio', {}).get('sample_rate', 22050)
+        return self.mel_to_audio(mel_output, sample_rate, normalize), synthetic
+    
+    def _stream_segments(self, phonemes: np.ndarray):
+        """Divide a sequência em trechos de até STREAM_CHUNK_PHONEMES fonemas
+        
+        Os cortes caem sempre depois de um espaço (fronteira de palavra) e
+        cada trecho recebe de volta o BOS/EOS da sequência original.
+        """
+        bos, body, eos = phonemes[:1], phonemes[1:-1], phonemes[-1:]
+        start = last_cut = 0
+        for cut in np.flatnonzero(body == self._space_id) + 1:
+            if cut - start > STREAM_CHUNK_PHONEMES and last_cut > start:
+                yield np.concatenate((bos, body[start:last_cut], eos))
+                start = last_cut
+            last_cut = cut
+        if start < len(body):
+            yield np.concatenate((bos, body[start:], eos))
+    
+    def synthesize_stream(self, text: str) -> Iterator[np.ndarray]:
+        """Gera o áudio em trechos, permitindo tocar o início antes do fim
+        
+        Os trechos não são normalizados um a um (o que faria o volume saltar
+        entre eles): saem com o ganho do próprio modelo, limitados a [-1, 1].
+        """
+        for segment in self._stream_segments(self._encode(text)[0]):
+            yield clip_audio(self._decode_chunk(segment, normalize=False)[0])
+    
+    async def synthesize_async(self, text: str, output_path: Optional[str] = None) -> np.ndarray:
+        """Versão assíncrona de `synthesize`, executada fora do event loop
+        
+        Usa o executor de uma thread da instância: as chamadas ficam em fila
+        sem bloquear o loop e sem disputar a sessão ONNX entre si.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.synthesize, text, output_path)
+    
+    async def synthesize_stream_async(self, text: str) -> AsyncIterator[np.ndarray]:
+        """Versão assíncrona de `synthesize_stream`: um trecho por vez no executor"""
+        loop = asyncio.get_running_loop()
+        phonemes, _ = await loop.run_in_executor(self._executor, self._encode, text)
+        for segment in self._stream_segments(phonemes):
+            audio, _ = await loop.run_in_executor(self._executor, self._decode_chunk, segment, False)
+            yield clip_audio(audio)
+    
+    def _cache_session_io(self):
+        """Consulta uma única vez as entradas/saídas da sessão ONNX"""
+        self._input_specs = [(inp.name, inp.shape) for inp in self.session.get_inputs()]
+        self._output_names = [out.name for out in self.session.get_outputs()]
+        # Piper exporta a forma de onda ("output", [B, 1, T]); modelos que
+        # devolvem mel trazem [B, n_mels, T] e ainda passam pelo vocoder
+        output = self.session.get_outputs()[0]
+        channels = output.shape[1] if len(output.shape) == 3 else 1
+        self._output_is_audio = output.name != 'mel' and not (isinstance(channels, int) and channels > 1)
+        self._input_role = {name: ONNX_INPUT_ROLES.get(name, 'other') for name, _ in self._input_specs}
+        # Modelos exportados com escalas por item esperam [B, 3] em vez de [3]
+        self._scales_per_item = any(
+            name == 'scales' and len(shape) == 2 for name, shape in self._input_specs
+        )
+        
+        # Parâmetros de escala (noise_scale, length_scale, noise_w)
+        inference = self.config.get('inference', {})
+        self._scales = np.array([
+            inference.get('noise_scale', 0.667),
+            inference.get('length_scale', 1.0),
+            inference.get('noise_w', 0.8),
+        ], dtype=np.float32)
+    
+    def _setup_io_binding(self):
+        """Prepara IOBinding e buffers reaproveitados entre as chamadas"""
+        self._io_binding = self.session.io_binding()
+        self._phoneme_buf = np.zeros((1, IO_BINDING_MAX_PHONEMES), dtype=np.int64)
+        self._length_buf = np.zeros(1, dtype=np.int64)
+        self._other_input_buf = np.zeros((1, 1), dtype=np.float32)
+        self._bound_scales = self._scales[np.newaxis, :] if self._scales_per_item else self._scales
+    
+    def _run_onnx(self, phonemes: np.ndarray) -> list:
+        """Executa o modelo para uma única sequência de fonemas
+        
+        Sequências de até IO_BINDING_MAX_PHONEMES usam os buffers fixos via
+        IOBinding (sem alocar entradas a cada chamada); as maiores seguem
+        pelo `session.run` comum.
+        """
+        length = len(phonemes)
+        if length > IO_BINDING_MAX_PHONEMES:
+            inputs = self._build_onnx_inputs(
+                phonemes[np.newaxis, :], np.array([length], dtype=np.int64)
+            )
+            with self._infer_lock:
+                return self.session.run(self._output_names, inputs)
+        
+        # Os buffers são compartilhados: preencher e executar sob o mesmo lock
+        with self._infer_lock:
+            np.copyto(self._phoneme_buf[0, :length], phonemes)
+            self._length_buf[0] = length
+            values = {
+                'phoneme': self._phoneme_buf[:, :length],
+                'length': self._length_buf,
+                'scales': self._bound_scales,
+                'other': self._other_input_buf,
+            }
+            for name, role in self._input_role.items():
+                self._io_binding.bind_cpu_input(name, values[role])
+            for name in self._output_names:
+                self._io_binding.bind_output(name)
+            
+            self.session.run_with_iobinding(self._io_binding)
+            return self._io_binding.copy_outputs_to_cpu()
+    
+    def _build_onnx_inputs(self, phoneme_input: np.ndarray, input_lengths: np.ndarray) -> dict:
+        """Monta o dicionário de entradas ONNX para um lote [B, T] de fonemas"""
+        batch_size = phoneme_input.shape[0]
+        values = {
+            'phoneme': phoneme_input,
+            'length': input_lengths,
+            'scales': np.tile(self._scales, (batch_size, 1)) if self._scales_per_item else self._scales,
+        }
+        # Para outros inputs, usar valores padrão
+        return {
+            name: values[role] if role != 'other' else np.zeros((batch_size, 1), dtype=np.float32)
+            for name, role in self._input_role.items()
+        }
+    
+    def synthesize_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Sintetiza vários textos com uma única chamada `session.run`
+        
+        Os fonemas são completados com 0 (pad) até o maior comprimento e
+        `input_lengths` informa o tamanho real de cada item. O modelo precisa
+        ter sido exportado com eixo de lote dinâmico, por exemplo:
+        
+            torch.onnx.export(..., dynamic_axes={
+                'input': {0: 'batch', 1: 'phonemes'},
+                'input_lengths': {0: 'batch'},
+                'output': {0: 'batch', 2: 'time'},
+            })
+        
+        Sem sessão ONNX, cada texto é sintetizado individualmente.
+        """
+        if not texts:
+            return []
+        if not self.onnx_available:
+            return [self.synthesize(text) for text in texts]
+        
+        language = self.config.get('language', 'pt')
+        sequences = [self.text_to_phonemes(text, language) for text in texts]
+        lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+        
+        phoneme_input = np.zeros((len(sequences), int(lengths.max())), dtype=np.int64)
+        for row, sequence in enumerate(sequences):
+            phoneme_input[row, :len(sequence)] = sequence
+        
+        inputs = self._build_onnx_inputs(phoneme_input, lengths)
+        with self._infer_lock:
+            result = self.session.run(self._output_names, inputs)
+        
+        # O modelo não informa o comprimento de saída de cada item: o trecho
+        # final correspondente ao padding é cortado depois da síntese
+        if self._output_is_audio:
+            return [
+                trim_trailing_silence(normalize_peak(np.asarray(row, dtype=np.float32).reshape(-1)))
+                for row in result[0]
+            ]
+        
+        sample_rate = self.config.get('audio', {}).get('sample_rate', 22050)
+        return [
+            trim_trailing_silence(self.mel_to_audio(trim_mel_padding(mel), sample_rate))
+            for mel in result[0]
+        ]
+    
+    def _save_audio(self, output_path: str, audio: np.ndarray, sample_rate: int):
+        """Salva o áudio, criando o diretório de destino se necessário"""
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        sf.write(output_path, audio, sample_rate)
+        print(f"💾 Áudio salvo em: {output_path}")
+    
     def generate_synthetic_mel(self, length: int) -> np.ndarray:
         """Gera mel-spectrogram sintético para fallback"""
         
@@ -252,12 +716,11 @@ class PiperTTSInference:
         time_steps = max(length * 4, 100)  # Aproximação
         mel_bins = 80
         
-        mel = np.zeros((mel_bins, time_steps))
-        
-        for i in range(mel_bins):
-            frequency = (i + 1) * 0.1
-            for t in range(time_steps):
-                mel[i, t] = np.sin(frequency * t * 0.1) * np.exp(-t * 0.01)
+        # sin(freq_i * t * 0.1) * exp(-t * 0.01) como produto externo
+        frequencies = (np.arange(mel_bins) + 1) * 0.1
+        t = np.arange(time_steps)
+        decay = np.exp(-t * 0.01)
+        mel = np.sin(frequencies[:, None] * t[None, :] * 0.1) * decay[None, :]
         
         # Normalizar
         mel = (mel - mel.min()) / (mel.max() - mel.min() + 1e-8)
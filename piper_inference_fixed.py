@@ -1,34 +1,237 @@
 #!/usr/bin/env python3
-"""Integração com Piper TTS usando CLI oficial via subprocess."""
+"""Integração com Piper TTS (API Python em processo, com CLI como fallback)."""
 
+import atexit
 import json
 import logging
 import os
+import queue
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache, partial
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
 
+try:  # Parser JSON em C, opcional (pip install orjson)
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import onnxruntime as ort
+    from piper.config import PiperConfig
+    from piper.voice import PiperVoice
+except ImportError:  # pacote piper-tts ausente: usar a CLI via subprocess
+    PiperVoice = None
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# O espeak-ng (fonemização do Piper) é global ao processo e não é thread-safe
+_VOICE_LOCK = threading.Lock()
+
+# close_fds=False torna as chamadas ao Piper elegíveis para posix_spawn (sem
+# fork + cópia da tabela de páginas do servidor). Seguro desde o PEP 446: os
+# descritores do Python já nascem não herdáveis.
+_SPAWN_KWARGS = {'close_fds': False}
+
+# Formatos de amostra aceitos por synthesize(dtype=...)
+SAMPLE_DTYPES = (np.dtype(np.int16), np.dtype(np.float32))
+
+# Linha de log do Piper (--output-dir) que anuncia o WAV gravado
+_WROTE_WAV = re.compile(r'Wrote (.+\.wav)')
+
+# Amplitude abaixo da qual o final de um item do lote é tratado como padding
+BATCH_PADDING_THRESHOLD = 1e-4
+
+
+def _session_options() -> "ort.SessionOptions":
+    """Opções ONNX para o decoder VITS: grafo otimizado e memória reaproveitada."""
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Arena + padrão de memória: buffers reaproveitados entre inferências
+    options.enable_cpu_mem_arena = True
+    options.enable_mem_pattern = True
+    # Uma thread por núcleo disponível para o processo; execução sequencial
+    if hasattr(os, 'sched_getaffinity'):
+        options.intra_op_num_threads = len(os.sched_getaffinity(0))
+    else:
+        options.intra_op_num_threads = os.cpu_count() or 1
+    options.inter_op_num_threads = 1
+    return options
+
+
+def _providers() -> list[str]:
+    """CUDA quando disponível, sempre com a CPU como fallback."""
+
+    if 'CUDAExecutionProvider' in ort.get_available_providers():
+        return ['CUDAExecutionProvider', 'CPUExecutionProvider']
+    return ['CPUExecutionProvider']
+
+
+def quantized_model_path(model_path) -> Path:
+    """Caminho do modelo quantizado em int8 (`modelo.int8.onnx`)."""
+    return Path(model_path).with_suffix('.int8.onnx')
+
+
+def quantize_model(model_path) -> Path:
+    """Gera (uma única vez, offline) a versão int8 dinâmica do modelo ONNX.
+
+    Chamado por `python piper_inference_fixed.py --quantize MODELO`; as duas
+    classes de inferência passam a usar `modelo.int8.onnx` quando ele existe.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output_path = quantized_model_path(model_path)
+    quantize_dynamic(
+        model_input=str(model_path),
+        model_output=str(output_path),
+        weight_type=QuantType.QInt8,
+        op_types_to_quantize=['MatMul', 'Gemm'],
+    )
+    return output_path
+
+
+@lru_cache(maxsize=128)
+def _load_cfg(path: str, mtime: float) -> dict:
+    """Configuração JSON do modelo, lida uma vez por (caminho, mtime).
+
+    O dicionário é compartilhado entre as instâncias: não deve ser alterado.
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+@lru_cache(maxsize=8)
+def _get_voice(model_path: str, config_path: str, config_mtime: float) -> "PiperVoice":
+    """Voz Piper compartilhada por (modelo, config): uma sessão ONNX por processo.
+
+    `config_mtime` entra na chave do cache: editar o JSON gera uma voz nova.
+    """
+
+    session = ort.InferenceSession(
+        model_path,
+        sess_options=_session_options(),
+        providers=_providers(),
+    )
+    config_data = _load_cfg(config_path, config_mtime)
+    voice = PiperVoice(config=PiperConfig.from_dict(config_data), session=session)
+
+    # Trocar o phonemes_to_ids do Piper (dict por fonema) pela tabela NumPy,
+    # só se ela gerar os mesmos IDs que o tokenizador da versão instalada
+    phoneme_id_map = config_data.get('phoneme_id_map', {})
+    id_table = _build_id_table(phoneme_id_map)
+    if id_table is not None and _same_ids(voice, id_table, phoneme_id_map):
+        voice.phonemes_to_ids = partial(_tokenize, id_table)
+
+    return voice
+
+
+def _build_id_table(phoneme_id_map: dict) -> np.ndarray | None:
+    """Tabela densa code point -> ID (-1 = fora do mapa).
+
+    Retorna None se o mapa tiver fonemas com mais de um caractere ou com
+    mais de um ID, ou não trouxer os marcadores de início/fim/pausa; nesse
+    caso o tokenizador original do Piper continua em uso.
+    """
+
+    if not phoneme_id_map or any(len(phoneme) != 1 for phoneme in phoneme_id_map):
+        return None
+    if any(len(ids) != 1 for ids in phoneme_id_map.values()):
+        return None
+    if not {'^', '$', '_'} <= phoneme_id_map.keys():
+        return None
+
+    id_table = np.full(max(map(ord, phoneme_id_map)) + 1, -1, dtype=np.int64)
+    for phoneme, ids in phoneme_id_map.items():
+        id_table[ord(phoneme)] = ids[0]
+    return id_table
+
+
+def _same_ids(voice: "PiperVoice", id_table: np.ndarray, phoneme_id_map: dict) -> bool:
+    """Confere _tokenize contra o phonemes_to_ids do Piper num texto de teste.
+
+    O layout BOS, (fonema, PAD)..., EOS é o do piper-tts 1.2; versões que
+    organizam os IDs de outra forma mantêm o tokenizador original.
+    """
+
+    probe = [phoneme for phoneme in phoneme_id_map if phoneme not in '^$_']
+    try:
+        expected = np.asarray(voice.phonemes_to_ids(probe), dtype=np.int64)
+    except Exception as exc:
+        logger.debug(f"Tokenizador do Piper falhou no teste: {exc}")
+        return False
+    return np.array_equal(_tokenize(id_table, probe), expected)
+
+
+def _tokenize(id_table: np.ndarray, phonemes: list[str]) -> np.ndarray:
+    """IDs no formato do Piper: BOS, (fonema, PAD) para cada fonema, EOS."""
+
+    codes = np.frombuffer(''.join(phonemes).encode('utf-32-le'), dtype=np.uint32)
+    ids = id_table[codes[codes < len(id_table)]]
+    ids = ids[ids >= 0]  # fonemas fora do mapa são ignorados, como no Piper
+
+    phoneme_ids = np.empty(2 * len(ids) + 2, dtype=np.int64)
+    phoneme_ids[0] = id_table[ord('^')]
+    phoneme_ids[1:-1:2] = ids
+    phoneme_ids[2:-1:2] = id_table[ord('_')]
+    phoneme_ids[-1] = id_table[ord('$')]
+    return phoneme_ids
+
+
+@lru_cache(maxsize=8)
+def _get_daemon(model_path: str, config_path: str) -> "PiperDaemon":
+    """Processo piper compartilhado por (modelo, config), encerrado na saída."""
+
+    daemon = PiperDaemon(model_path, config_path)
+    atexit.register(daemon.close)
+    return daemon
+
+
+def _sample_dtype(dtype) -> np.dtype:
+    """Valida o dtype de saída: int16 (PCM como gerado) ou float32 em [-1, 1]."""
+
+    dtype = np.dtype(dtype)
+    if dtype not in SAMPLE_DTYPES:
+        raise ValueError(f"dtype deve ser int16 ou float32, não {dtype}")
+    return dtype
+
+
+def _output_buffer(out: np.ndarray | None, frames: int, dtype=np.float32) -> np.ndarray:
+    """View de `frames` amostras `dtype`: em `out`, se fornecido, ou nova."""
+
+    if out is None:
+        return np.empty(frames, dtype=dtype)
+    if out.dtype != dtype or out.ndim != 1:
+        raise ValueError(f"out deve ser um array {np.dtype(dtype)} 1-D")
+    if out.size < frames:
+        raise ValueError(f"out tem {out.size} amostras, são necessárias {frames}")
+    return out[:frames]
+
 
 class PiperTTSInference:
-    """Wrapper usando Piper CLI via subprocess."""
+    """Wrapper do Piper: voz carregada uma vez em processo, CLI como fallback."""
 
-    def __init__(self, model_path: str, config_path: str):
+    def __init__(self, model_path: str, config_path: str, use_daemon: bool = False):
         self.model_path = Path(model_path)
         self.config_path = Path(config_path)
         self._config_data = {}
 
         # Carregar configuração JSON
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config_data = json.load(f)
+            self._config_mtime = os.path.getmtime(self.config_path)
+            self._config_data = _load_cfg(str(self.config_path), self._config_mtime)
             logger.info("✅ Configuração Piper carregada com sucesso")
         except Exception as exc:
             logger.error(f"❌ Falha ao carregar configuração: {exc}")
@@ -38,27 +241,156 @@ class PiperTTSInference:
         if not self.model_path.exists():
             raise FileNotFoundError(f"Modelo não encontrado: {self.model_path}")
 
+        # Preferir o modelo int8 (gerado por quantize_model) quando existir,
+        # a menos que a configuração traga "quantize": false
+        quantized = quantized_model_path(self.model_path)
+        if self._config_data.get('quantize', True) and quantized.exists():
+            logger.info(f"⚡ Usando modelo quantizado: {quantized.name}")
+            self.model_path = quantized
+
+        # Partes fixas da linha de comando da CLI
+        self._cmd_prefix = [
+            sys.executable,
+            '-m',
+            'piper',
+            '--model',
+            str(self.model_path),
+            '--config',
+            str(self.config_path),
+        ]
+
+        # Carregar a voz uma única vez (modelo + sessão ONNX) para todas as sínteses
+        self.voice = None
+        if PiperVoice is not None:
+            try:
+                self.voice = _get_voice(
+                    str(self.model_path), str(self.config_path), self._config_mtime
+                )
+                logger.info("✅ Voz Piper pronta em processo")
+            except Exception as exc:
+                logger.warning(f"⚠️ Falha ao carregar voz em processo, usando CLI: {exc}")
+        else:
+            logger.warning("⚠️ Pacote piper-tts não encontrado, usando CLI via subprocess")
+
+        # Sem voz em processo: opcionalmente um processo piper persistente,
+        # que carrega o modelo uma vez em vez de a cada síntese
+        self.daemon = None
+        if self.voice is None and use_daemon:
+            self.daemon = _get_daemon(str(self.model_path), str(self.config_path))
+
+        # Status calculado uma vez: a existência do modelo já foi verificada
+        # acima, então test_model_loading não precisa consultar o disco
+        self._status = {
+            'ready': bool(self._config_data),
+            'config_loaded': bool(self._config_data),
+            'session_loaded': True,
+            'model_loaded': True,
+            'sample_rate': self.sample_rate,
+            'language': self._config_data.get('espeak', {}).get('voice'),
+        }
+
     @property
     def sample_rate(self) -> int:
         """Retorna sample rate do modelo."""
         return int(self._config_data.get('audio', {}).get('sample_rate', 22050))
 
-    def synthesize(self, text: str, output_path: str | None = None) -> np.ndarray:
+    def synthesize(
+        self,
+        text: str,
+        output_path: str | None = None,
+        out: np.ndarray | None = None,
+        dtype='int16',
+    ) -> np.ndarray:
+        """Sintetiza áudio com a voz em processo (ou a CLI, se indisponível).
+
+        `dtype='int16'` (padrão) devolve o PCM como o Piper gera, pronto para
+        WAV/HTTP, sem conversão; use `dtype='float32'` para amostras em [-1, 1].
+        Se `out` (1-D, do mesmo dtype) for informado, as amostras são escritas
+        nele e o retorno é uma view `out[:n]`, permitindo reaproveitar o buffer.
+        """
+
+        dtype = _sample_dtype(dtype)
+        if self.voice is None and self.daemon is None:
+            return self._synthesize_cli(text, output_path, out, dtype)
+
+        logger.info(f"🎤 Sintetizando com Piper: '{text}'")
+
+        try:
+            if self.voice is not None:
+                audio = self._synthesize_in_process(text, out, dtype)
+            else:
+                audio = self.daemon.synthesize(text, out, dtype)
+            logger.info(f"✅ Síntese concluída: {len(audio)} amostras @ {self.sample_rate}Hz")
+
+        except Exception as exc:
+            logger.error(f"❌ Erro durante síntese: {exc}")
+            raise
+
+        if output_path:
+            self._ensure_parent_dir(output_path)
+            sf.write(output_path, audio, self.sample_rate, subtype='PCM_16')
+
+        return audio
+
+    def _synthesize_in_process(
+        self, text: str, out: np.ndarray | None, dtype: np.dtype
+    ) -> np.ndarray:
+        """Síntese com a voz carregada em processo."""
+
+        chunks = self._pcm_chunks(text)
+
+        # PCM int16 direto no buffer de saída (convertido se for float32)
+        audio = _output_buffer(out, sum(len(chunk) for chunk in chunks) // 2, dtype)
+        offset = 0
+        for chunk in chunks:
+            pcm = np.frombuffer(chunk, dtype=np.int16)
+            audio[offset:offset + len(pcm)] = pcm
+            offset += len(pcm)
+        if dtype == np.float32:
+            audio *= 1.0 / 32768.0
+        return audio
+
+    def _ensure_parent_dir(self, path: str):
+        """Cria o diretório de `path`, se necessário (nome sem diretório: '.')."""
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    def _pcm_chunks(self, text: str) -> list[bytes]:
+        """Blocos PCM int16 gerados pela voz (um por sentença)."""
+
+        # Só o espeak-ng (fonemização) não é thread-safe; a inferência ONNX
+        # roda fora do lock, como no BatchingSynthesizer
+        with _VOICE_LOCK:
+            sentences = self.voice.phonemize(text)
+
+        chunks = []
+        for phonemes in sentences:
+            phoneme_ids = self.voice.phonemes_to_ids(phonemes)
+            # piper-tts < 1.3 expõe synthesize_ids_to_raw; a partir da 1.3,
+            # phoneme_ids_to_audio devolve float32 sem normalização
+            if hasattr(self.voice, 'synthesize_ids_to_raw'):
+                chunks.append(self.voice.synthesize_ids_to_raw(phoneme_ids))
+                continue
+            audio = np.asarray(self.voice.phoneme_ids_to_audio(phoneme_ids), dtype=np.float32)
+            audio = audio.reshape(-1) / max(0.01, float(np.abs(audio).max(initial=0.0)))
+            chunks.append((np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+        return chunks
+
+    def _synthesize_cli(
+        self,
+        text: str,
+        output_path: str | None = None,
+        out: np.ndarray | None = None,
+        dtype: np.dtype = np.dtype(np.int16),
+    ) -> np.ndarray:
         """Sintetiza áudio usando Piper CLI via subprocess."""
 
         logger.info(f"🎤 Sintetizando com Piper CLI: '{text}'")
 
-        # Criar arquivo temporário para o texto
-        with tempfile.NamedTemporaryFile(
-            mode='w', encoding='utf-8', suffix='.txt', delete=False
-        ) as text_file:
-            text_file.write(text)
-            text_file_path = text_file.name
-
         # Criar arquivo temporário para o áudio (ou usar output_path)
         if output_path:
             wav_file_path = output_path
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            self._ensure_parent_dir(output_path)
         else:
             wav_file = tempfile.NamedTemporaryFile(
                 suffix='.wav', delete=False
@@ -68,26 +400,20 @@ class PiperTTSInference:
 
         try:
             # Executar Piper CLI
-            cmd = [
-                sys.executable,
-                '-m',
-                'piper',
-                '--model',
-                str(self.model_path),
-                '--config',
-                str(self.config_path),
-                '--input-file',
-                text_file_path,
-                '--output-file',
-                wav_file_path,
-            ]
+            cmd = self._cmd_prefix + ['--output-file', wav_file_path]
 
+            # Texto enviado pelo stdin, sem arquivo temporário de entrada
             logger.info(f"🚀 Executando: {' '.join(cmd)}")
             result = subprocess.run(
                 cmd,
+                input=text,
                 capture_output=True,
                 text=True,
+                encoding='utf-8',
                 check=True,
+                # Texto acentuado em UTF-8 nos dois lados, também no Windows
+                env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},
+                **_SPAWN_KWARGS,
             )
 
             if result.stdout:
@@ -96,7 +422,10 @@ class PiperTTSInference:
                 logger.debug(f"Piper stderr: {result.stderr}")
 
             # Carregar áudio gerado
-            audio, sr = sf.read(wav_file_path, dtype='float32')
+            with sf.SoundFile(wav_file_path) as wav:
+                audio = _output_buffer(out, wav.frames, dtype)
+                wav.read(dtype=dtype.name, out=audio)
+                sr = wav.samplerate
             logger.info(f"✅ Síntese concluída: {len(audio)} amostras @ {sr}Hz")
 
             return audio
@@ -112,12 +441,6 @@ class PiperTTSInference:
             raise
 
         finally:
-            # Limpar arquivo temporário de texto
-            try:
-                os.unlink(text_file_path)
-            except Exception:
-                pass
-
             # Limpar arquivo temporário de áudio se não for output_path
             if not output_path:
                 try:
@@ -128,11 +451,283 @@ class PiperTTSInference:
     def test_model_loading(self) -> dict:
         """Retorna status básico do carregamento."""
 
-        return {
-            'ready': self.model_path.exists() and bool(self._config_data),
-            'config_loaded': bool(self._config_data),
-            'session_loaded': True,
-            'model_loaded': self.model_path.exists(),
-            'sample_rate': self.sample_rate,
-            'language': self._config_data.get('espeak', {}).get('voice'),
-        }
\ No newline at end of file
+        # Cópia rasa: o chamador pode alterar o dict sem afetar o cache
+        return dict(self._status)
+
+
+class PiperDaemon:
+    """Processo `python -m piper` persistente, um texto por linha no stdin.
+
+    O Piper grava um WAV por linha em `--output-dir` e registra o caminho no
+    stderr ("Wrote ..."), que serve de marcador de fim de cada síntese. Um
+    pedido por vez; para paralelismo, use vários daemons.
+    """
+
+    def __init__(self, model_path: str, config_path: str):
+        self._output_dir = tempfile.mkdtemp(prefix='piper-daemon-')
+        self._lock = threading.Lock()
+        self._cmd = [
+            sys.executable,
+            '-m',
+            'piper',
+            '--model',
+            model_path,
+            '--config',
+            config_path,
+            '--output-dir',
+            self._output_dir,
+        ]
+        self._proc = self._start()
+
+    def _start(self) -> subprocess.Popen:
+        logger.info(f"🚀 Iniciando daemon Piper: {' '.join(self._cmd)}")
+        return subprocess.Popen(
+            self._cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            bufsize=1,
+            # stdin/stderr do filho em UTF-8 também no Windows (cp1252)
+            env={**os.environ, 'PYTHONIOENCODING': 'utf-8'},
+            **_SPAWN_KWARGS,
+        )
+
+    def _restart(self):
+        """Substitui um processo que encerrou (a instância fica no cache)."""
+
+        self._proc.kill()  # sem efeito se já encerrou; garante o wait abaixo
+        logger.warning(f"⚠️ Daemon Piper encerrou (código {self._proc.wait()}), reiniciando")
+        for pipe in (self._proc.stdin, self._proc.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        self._proc = self._start()
+
+    def synthesize(
+        self, text: str, out: np.ndarray | None = None, dtype='int16'
+    ) -> np.ndarray:
+        """Sintetiza `text` no processo persistente (amostras int16 ou float32)."""
+
+        dtype = _sample_dtype(dtype)
+        # Cada linha é um pedido: quebras de linha viram espaços
+        line = ' '.join(text.split())
+        if not line:
+            return _output_buffer(out, 0, dtype)
+
+        with self._lock:
+            if self._proc.poll() is not None:
+                self._restart()
+            try:
+                self._proc.stdin.write(line + '\n')
+                self._proc.stdin.flush()
+            except BrokenPipeError:
+                # Morreu entre a verificação e a escrita: uma nova tentativa
+                self._restart()
+                self._proc.stdin.write(line + '\n')
+                self._proc.stdin.flush()
+            wav_path = self._wait_for_wav()
+
+        try:
+            with sf.SoundFile(wav_path) as wav:
+                audio = _output_buffer(out, wav.frames, dtype)
+                wav.read(dtype=dtype.name, out=audio)
+            return audio
+        finally:
+            os.unlink(wav_path)
+
+    def _wait_for_wav(self) -> str:
+        for line in self._proc.stderr:
+            match = _WROTE_WAV.search(line)
+            if match:
+                return match.group(1)
+            logger.debug(f"Piper stderr: {line.rstrip()}")
+        raise RuntimeError(f"Daemon Piper encerrou (código {self._proc.wait()})")
+
+    def close(self):
+        """Encerra o processo e remove o diretório de saída."""
+
+        if self._proc.poll() is None:
+            self._proc.stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+        shutil.rmtree(self._output_dir, ignore_errors=True)
+
+
+class BatchingSynthesizer:
+    """Agrupa pedidos simultâneos numa única inferência ONNX em lote.
+
+    Textos que chegam até `max_delay` segundos depois do primeiro são
+    fonemizados e cada sentença vira uma linha do lote, completada com zeros
+    até o maior comprimento, como em `synthesize()`. Cada chamador recebe o
+    seu áudio (int16 por padrão, ou float32 em [-1, 1]).
+    Requer a voz em processo (pacote piper-tts); `close()` encerra a thread.
+    """
+
+    def __init__(self, inference: PiperTTSInference, max_batch: int = 8, max_delay: float = 0.01):
+        if inference.voice is None:
+            raise RuntimeError("BatchingSynthesizer requer a voz Piper em processo")
+
+        self.voice = inference.voice
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._input_names = {inp.name for inp in self.voice.session.get_inputs()}
+        self._queue: "queue.Queue[tuple[str, np.dtype, Future] | None]" = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='piper-batch', daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str, dtype='int16') -> Future:
+        """Enfileira um texto; o Future resolve com o áudio sintetizado."""
+
+        dtype = _sample_dtype(dtype)
+        if self._closed:
+            raise RuntimeError("BatchingSynthesizer já foi encerrado")
+        future: Future = Future()
+        self._queue.put((text, dtype, future))
+        return future
+
+    def synthesize(self, text: str, dtype='int16') -> np.ndarray:
+        """Versão bloqueante de `submit`."""
+
+        return self.submit(text, dtype).result()
+
+    def close(self, timeout: float | None = None):
+        """Processa os pedidos já enfileirados e encerra a thread do lote."""
+
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: list):
+        # Pedidos cancelados saem do lote; os demais passam a "running" e não
+        # podem mais ser cancelados, então set_result/set_exception é seguro.
+        pending = []
+        for text, dtype, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            # Fonemizar item a item: um texto vazio ou inválido só falha o
+            # próprio Future, sem derrubar os outros pedidos do lote.
+            try:
+                sentences = self._sentence_ids(text)
+                if not sentences:
+                    raise ValueError("texto sem fonemas para sintetizar")
+            except Exception as exc:
+                logger.error(f"❌ Erro ao fonemizar texto do lote: {exc}")
+                future.set_exception(exc)
+                continue
+            pending.append((sentences, dtype, future))
+
+        if not pending:
+            return
+
+        rows = [sequence for sentences, _, _ in pending for sequence in sentences]
+        try:
+            audios = []
+            for start in range(0, len(rows), self.max_batch):
+                audios.extend(self._infer(rows[start:start + self.max_batch]))
+        except Exception as exc:
+            logger.error(f"❌ Erro na síntese em lote: {exc}")
+            for _, _, future in pending:
+                future.set_exception(exc)
+            return
+
+        # Áudio de cada pedido: suas sentenças, na ordem, concatenadas
+        offset = 0
+        for sentences, dtype, future in pending:
+            audio = np.concatenate(audios[offset:offset + len(sentences)])
+            offset += len(sentences)
+            if dtype == np.int16:
+                audio = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+            future.set_result(audio)
+
+    def _sentence_ids(self, text: str) -> list[list[int]]:
+        """IDs de fonemas de cada sentença (cada uma com o seu BOS/EOS)."""
+
+        with _VOICE_LOCK:
+            sentences = self.voice.phonemize(text)
+
+        sequences = [list(self.voice.phonemes_to_ids(phonemes)) for phonemes in sentences]
+        return [sequence for sequence in sequences if sequence]
+
+    def _infer(self, sequences: list[list[int]]) -> list[np.ndarray]:
+        lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+
+        # Completar com zeros à direita até a maior sequência do lote
+        phoneme_ids = np.zeros((len(sequences), int(lengths.max())), dtype=np.int64)
+        for row, sequence in enumerate(sequences):
+            phoneme_ids[row, :len(sequence)] = sequence
+
+        config = self.voice.config
+        # piper-tts 1.3 renomeou noise_w para noise_w_scale
+        noise_w = getattr(config, 'noise_w_scale', None)
+        if noise_w is None:
+            noise_w = config.noise_w
+        inputs = {
+            'input': phoneme_ids,
+            'input_lengths': lengths,
+            'scales': np.array(
+                [config.noise_scale, config.length_scale, noise_w], dtype=np.float32
+            ),
+        }
+        if 'sid' in self._input_names:
+            inputs['sid'] = np.zeros(len(sequences), dtype=np.int64)
+
+        logger.info(f"🎤 Síntese em lote: {len(sequences)} sentenças")
+        output = self.voice.session.run(None, inputs)[0]  # [B, 1, T]
+        return [_trim_padding(audio.reshape(-1)) for audio in output]
+
+
+def _trim_padding(audio: np.ndarray) -> np.ndarray:
+    """Normaliza o pico (como o Piper) e corta o silêncio de padding final."""
+
+    audio = audio / max(0.01, float(np.abs(audio).max(initial=0.0)))
+    voiced = np.flatnonzero(np.abs(audio) > BATCH_PADDING_THRESHOLD)
+    return audio[:voiced[-1] + 1] if voiced.size else audio[:0]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ferramentas offline dos modelos Piper")
+    parser.add_argument(
+        '--quantize',
+        metavar='MODELO',
+        nargs='+',
+        required=True,
+        help="Gera modelo.int8.onnx (quantização dinâmica int8) ao lado de cada modelo.",
+    )
+    args = parser.parse_args()
+
+    for model in args.quantize:
+        output = quantize_model(model)
+        logger.info(f"✅ Modelo quantizado: {output}")
@@ -4,11 +4,42 @@ Teste rápido e simples dos modelos de voz Piper TTS.
 Verifica se cada modelo consegue gerar áudio básico.
 """
 
+import asyncio
 import requests
 import json
-import time
 import os
 
+from _test_client import SESSION, TIMEOUT_ERRORS, post_all
+
+
+def describe_response(response):
+    """Interpreta a resposta de /test_voice. Retorna (sucesso, mensagem)."""
+    if response.status_code == 200:
+        result = response.json()
+        if result.get('success'):
+            return True, f"✅ SUCESSO - {result.get('audio_url')}"
+        return False, f"❌ FALHA - {result.get('error', 'Erro desconhecido')}"
+    return False, f"❌ FALHA - HTTP {response.status_code}"
+
+def describe_outcome(outcome):
+    """Resposta (ou exceção) de post_all. Retorna (sucesso, mensagem)."""
+    try:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return describe_response(outcome)
+            
+    except TIMEOUT_ERRORS:
+        return False, "❌ TIMEOUT - Modelo muito lento"
+        
+    except Exception as e:
+        return False, f"❌ ERRO - {str(e)}"
+
+def probe_all(base_url, test_cases):
+    """Testa todos os modelos ao mesmo tempo; resultados na ordem de test_cases."""
+    # Teste com timeout de 10 segundos
+    outcomes = asyncio.run(post_all(test_cases, timeout=10, base_url=base_url))
+    return [describe_outcome(outcome) for outcome in outcomes]
+
 def quick_test():
     """Teste rápido de cada modelo com timeout curto."""
     
@@ -28,40 +59,11 @@ def quick_test():
     working_models = []
     failed_models = []
     
-    for model_name, text in test_cases:
-        print(f"\n🎯 Testando {model_name}...")
-        
-        try:
-            # Teste com timeout de 10 segundos
-            response = requests.post(
-                f"{base_url}/test_voice",
-                json={"model_name": model_name, "text": text},
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('success'):
-                    audio_url = result.get('audio_url')
-                    print(f"  ✅ SUCESSO - {audio_url}")
-                    working_models.append(model_name)
-                else:
-                    print(f"  ❌ FALHA - {result.get('error', 'Erro desconhecido')}")
-                    failed_models.append(model_name)
-            else:
-                print(f"  ❌ FALHA - HTTP {response.status_code}")
-                failed_models.append(model_name)
-                
-        except requests.exceptions.Timeout:
-            print(f"  ❌ TIMEOUT - Modelo muito lento")
-            failed_models.append(model_name)
-            
-        except Exception as e:
-            print(f"  ❌ ERRO - {str(e)}")
-            failed_models.append(model_name)
-        
-        # Pequena pausa entre testes
-        time.sleep(0.5)
+    # Todos os modelos ao mesmo tempo: o tempo total é o do mais lento
+    for (model_name, _), (ok, message) in zip(test_cases, probe_all(base_url, test_cases)):
+        print(f"\n🎯 {model_name}")
+        print(f"  {message}")
+        (working_models if ok else failed_models).append(model_name)
     
     # Resumo
     print(f"\n{'='*40}")
@@ -82,7 +84,7 @@ def quick_test():
 if __name__ == "__main__":
     try:
         # Verificar se servidor está respondendo
-        response = requests.get("http://localhost:5000/models", timeout=5)
+        response = SESSION.get("http://localhost:5000/models", timeout=5)
         if response.status_code == 200:
             quick_test()
         else:
@@ -4,12 +4,74 @@ Script para testar todos os modelos de voz com diferentes textos
 e verificar se estão gerando áudio corretamente.
 """
 
+import asyncio
 import requests
 import json
-import time
 import os
 from pathlib import Path
 
+from _test_client import SESSION, TIMEOUT_ERRORS, post_all
+
+
+def describe_response(response):
+    """Interpreta a resposta de /test_voice. Retorna (audio_url, mensagem, erro).
+
+    Em caso de sucesso da API, apenas audio_url é preenchido; a existência do
+    arquivo é conferida depois, por check_audio.
+    """
+    if response.status_code == 200:
+        result = response.json()
+        if result.get('success'):
+            return result.get('audio_url'), None, None
+        error = result.get('error', 'Erro desconhecido')
+        return None, f"❌ FALHA - API retornou erro: {error}", f"API error: {error}"
+    return None, f"❌ FALHA - Status HTTP: {response.status_code}", f"HTTP {response.status_code}"
+
+def describe_outcome(outcome):
+    """Resposta (ou exceção) de post_all. Retorna (audio_url, mensagem, erro)."""
+    try:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return describe_response(outcome)
+            
+    except TIMEOUT_ERRORS:
+        return None, "❌ FALHA - Tempo limite excedido (30s)", "Timeout"
+        
+    except Exception as e:
+        return None, f"❌ FALHA - Erro: {str(e)}", str(e)
+
+async def run_rounds(base_url, jobs):
+    """Uma rodada por índice de texto: o i-ésimo texto de cada modelo, juntos."""
+    results = [[] for _ in jobs]
+    rounds = max((len(texts) for _, texts in jobs), default=0)
+    for index in range(rounds):
+        active = [row for row, (_, texts) in enumerate(jobs) if index < len(texts)]
+        outcomes = await post_all(
+            [(jobs[row][0], jobs[row][1][index]) for row in active],
+            timeout=30,  # Timeout de 30 segundos
+            base_url=base_url,
+        )
+        for row, outcome in zip(active, outcomes):
+            results[row].append(describe_outcome(outcome))
+    return results
+
+def run_all(base_url, jobs):
+    """Executa os pares (modelo, textos) em paralelo; resultados na ordem de jobs.
+
+    Modelos diferentes rodam em paralelo, mas os textos de um mesmo modelo
+    são testados em sequência, sem competir pelo mesmo modelo no servidor.
+    """
+    return asyncio.run(run_rounds(base_url, jobs))
+
+def check_audio(audio_url, audio_entries):
+    """Confere o arquivo gerado. Retorna (sucesso, mensagem, erro)."""
+    entry = audio_entries.get(os.path.basename(audio_url))
+    if entry is not None:
+        file_size = entry.stat().st_size
+        return True, f"✅ SUCESSO - Áudio gerado: {audio_url} ({file_size} bytes)", None
+    audio_path = f"static/audio/{os.path.basename(audio_url)}"
+    return False, f"❌ FALHA - Arquivo de áudio não encontrado: {audio_path}", f"Arquivo não encontrado: {audio_path}"
+
 def test_all_models():
     """Testa todos os modelos disponíveis com textos apropriados."""
     
@@ -45,7 +107,7 @@ def test_all_models():
     
     # Primeiro, obter lista de modelos disponíveis
     try:
-        response = requests.get(f"{base_url}/models")
+        response = SESSION.get(f"{base_url}/models")
         models = response.json()
         print(f"📋 Modelos encontrados: {len(models)}")
         for model in models:
@@ -60,6 +122,23 @@ def test_all_models():
     total_tests = 0
     passed_tests = 0
     
+    # Disparar os modelos de uma vez (o tempo total passa a ser o do modelo
+    # mais lento); os textos de cada modelo seguem em sequência
+    jobs = [
+        (model_info['name'], test_texts[model_info['name']])
+        for model_info in models
+        if model_info['name'] in test_texts
+    ]
+    outcomes = iter([outcome for results in run_all(base_url, jobs) for outcome in results])
+    
+    # Com todos os testes concluídos, listar os áudios gerados de uma vez
+    # (o DirEntry guarda o stat, evitando exists + getsize por arquivo)
+    try:
+        audio_entries = {entry.name: entry for entry in os.scandir("static/audio")}
+    except FileNotFoundError:
+        audio_entries = {}
+    
+    # Relatório na ordem original dos modelos e textos
     for model_info in models:
         model_name = model_info['name']
         print(f"\n🎯 Testando modelo: {model_name}")
@@ -76,58 +155,23 @@ def test_all_models():
             'errors': []
         }
         
-        # Testar cada texto
         for i, text in enumerate(test_texts[model_name], 1):
             total_tests += 1
             resultados[model_name]['total'] += 1
             
             print(f"\n  Teste {i}: {text}")
             
-            try:
-                # Fazer requisição para gerar áudio
-                response = requests.post(
-                    f"{base_url}/test_voice",
-                    json={"model_name": model_name, "text": text},
-                    timeout=30  # Timeout de 30 segundos
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get('success'):
-                        audio_url = result.get('audio_url')
-                        audio_path = f"static/audio/{os.path.basename(audio_url)}"
-                        
-                        # Verificar se o arquivo de áudio foi criado
-                        if os.path.exists(audio_path):
-                            file_size = os.path.getsize(audio_path)
-                            print(f"  ✅ SUCESSO - Áudio gerado: {audio_url} ({file_size} bytes)")
-                            resultados[model_name]['passed'] += 1
-                            passed_tests += 1
-                        else:
-                            print(f"  ❌ FALHA - Arquivo de áudio não encontrado: {audio_path}")
-                            resultados[model_name]['failed'] += 1
-                            resultados[model_name]['errors'].append(f"Arquivo não encontrado: {audio_path}")
-                    else:
-                        print(f"  ❌ FALHA - API retornou erro: {result.get('error', 'Erro desconhecido')}")
-                        resultados[model_name]['failed'] += 1
-                        resultados[model_name]['errors'].append(f"API error: {result.get('error', 'Erro desconhecido')}")
-                else:
-                    print(f"  ❌ FALHA - Status HTTP: {response.status_code}")
-                    resultados[model_name]['failed'] += 1
-                    resultados[model_name]['errors'].append(f"HTTP {response.status_code}")
-                    
-            except requests.exceptions.Timeout:
-                print(f"  ❌ FALHA - Tempo limite excedido (30s)")
+            audio_url, message, error = next(outcomes)
+            passed = False
+            if audio_url is not None:
+                passed, message, error = check_audio(audio_url, audio_entries)
+            print(f"  {message}")
+            if passed:
+                resultados[model_name]['passed'] += 1
+                passed_tests += 1
+            else:
                 resultados[model_name]['failed'] += 1
-                resultados[model_name]['errors'].append("Timeout")
-                
-            except Exception as e:
-                print(f"  ❌ FALHA - Erro: {str(e)}")
-                resultados[model_name]['failed'] += 1
-                resultados[model_name]['errors'].append(str(e))
-            
-            # Pequena pausa entre testes
-            time.sleep(0.5)
+                resultados[model_name]['errors'].append(error)
     
     # Resumo final
     print("\n" + "=" * 60)
@@ -162,7 +206,7 @@ def test_all_models():
 if __name__ == "__main__":
     # Verificar se o servidor está rodando
     try:
-        response = requests.get("http://localhost:5000/models", timeout=5)
+        response = SESSION.get("http://localhost:5000/models", timeout=5)
         if response.status_code == 200:
             test_all_models()
         else:
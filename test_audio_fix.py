@@ -2,11 +2,47 @@
 """
 Script de teste para verificar e corrigir problemas de geração de áudio
 """
+import asyncio
 import os
 import json
 import requests
 import subprocess
-import time
+
+from _test_client import HTTP_ERRORS, SESSION, post_all
+
+
+TEST_TEXT = "Este é um teste de geração de áudio."
+
+def describe_response(model_name, response):
+    """Interpreta a resposta de /test_voice. Retorna (sucesso, linhas)."""
+    if response.status_code == 200:
+        result = response.json()
+        if result.get('success'):
+            return True, [
+                f"✅ {model_name}: SUCESSO",
+                f"   📁 Áudio gerado: {result.get('audio_url')}",
+                f"   💬 Mensagem: {result.get('message')}",
+            ]
+        return False, [f"❌ {model_name}: FALHA - {result.get('error')}"]
+    return False, [f"❌ {model_name}: HTTP {response.status_code}"]
+
+def describe_outcome(model_name, outcome):
+    """Resposta (ou exceção) de post_all para o modelo. Retorna (sucesso, linhas)."""
+    try:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return describe_response(model_name, outcome)
+            
+    except HTTP_ERRORS as e:
+        return False, [f"❌ {model_name}: Erro de conexão - {e}"]
+    except Exception as e:
+        return False, [f"❌ {model_name}: Erro inesperado - {e}"]
+
+def generate_all(models):
+    """Testa os modelos em paralelo; resultados na ordem de models"""
+    # Pedidos ao servidor local, todos de uma vez
+    outcomes = asyncio.run(post_all([(name, TEST_TEXT) for name in models], timeout=30))
+    return [describe_outcome(name, outcome) for name, outcome in zip(models, outcomes)]
 
 def test_audio_generation():
     """Testa a geração de áudio com os modelos disponíveis"""
@@ -33,43 +69,11 @@ def test_audio_generation():
     # Criar diretório de teste
     os.makedirs("static/audio/test", exist_ok=True)
     
-    for model_name in models:
+    # Todos os modelos ao mesmo tempo; saída na ordem da lista
+    for model_name, (passed, lines) in zip(models, generate_all(models)):
         print(f"\n🎤 Testando modelo: {model_name}")
-        
-        try:
-            # Preparar dados para teste
-            test_data = {
-                "model_name": model_name,
-                "text": "Este é um teste de geração de áudio."
-            }
-            
-            # Fazer requisição ao servidor local
-            response = requests.post(
-                "http://localhost:5000/test_voice",
-                json=test_data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('success'):
-                    print(f"✅ {model_name}: SUCESSO")
-                    print(f"   📁 Áudio gerado: {result.get('audio_url')}")
-                    print(f"   💬 Mensagem: {result.get('message')}")
-                    test_passed.append(model_name)
-                else:
-                    print(f"❌ {model_name}: FALHA - {result.get('error')}")
-                    test_failed.append(model_name)
-            else:
-                print(f"❌ {model_name}: HTTP {response.status_code}")
-                test_failed.append(model_name)
-                
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {model_name}: Erro de conexão - {e}")
-            test_failed.append(model_name)
-        except Exception as e:
-            print(f"❌ {model_name}: Erro inesperado - {e}")
-            test_failed.append(model_name)
+        print("\n".join(lines))
+        (test_passed if passed else test_failed).append(model_name)
     
     # Relatório final
     print(f"\n📊 RELATÓRIO DE TESTES:")
@@ -83,7 +87,7 @@ def test_audio_generation():
     
     # Verificar servidor
     try:
-        response = requests.get("http://localhost:5000/models", timeout=5)
+        response = SESSION.get("http://localhost:5000/models", timeout=5)
         if response.status_code == 200:
             models_data = response.json()
             print(f"\n📋 Modelos disponíveis no servidor: {len(models_data)}")
@@ -97,7 +101,7 @@ def test_transcription_engines():
     print("\n🎤 Testando engines de transcrição...")
     
     try:
-        response = requests.get("http://localhost:5000/transcription_engines", timeout=10)
+        response = SESSION.get("http://localhost:5000/transcription_engines", timeout=10)
         if response.status_code == 200:
             data = response.json()
             print(f"✅ Engines disponíveis: {data.get('engines', [])}")
@@ -111,13 +115,9 @@ if __name__ == "__main__":
     print("🔧 Testando sistema Piper TTS")
     print("=" * 50)
     
-    # Aguardar servidor iniciar
-    print("⏳ Aguardando servidor iniciar...")
-    time.sleep(2)
-    
     # Testar conexão com servidor
     try:
-        response = requests.get("http://localhost:5000/", timeout=5)
+        response = SESSION.get("http://localhost:5000/", timeout=5)
         if response.status_code == 200:
             print("✅ Servidor web está rodando")
         else:
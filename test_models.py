@@ -1,56 +1,68 @@
 #!/usr/bin/env python3
 """Script para testar os modelos de voz"""
 
+import asyncio
 import requests
 import json
-import time
 
-def test_model(model_name, text, language):
-    """Testa um modelo de voz específico"""
-    print(f"\n🎯 Testando {model_name} ({language})...")
-    print(f"Texto: '{text}'")
+from _test_client import CONNECT_ERRORS, TIMEOUT_ERRORS, post_all
+
+
+def report_response(response, lines):
+    """Acrescenta o resultado de /test_voice em lines. Retorna o sucesso."""
+    lines.append(f"Status: {response.status_code}")
     
-    try:
-        response = requests.post(
-            'http://localhost:5000/test_voice',
-            json={'model_name': model_name, 'text': text},
-            timeout=30
-        )
+    if response.status_code == 200:
+        result = response.json()
+        audio_url = result.get('audio_url', 'Sem URL')
+        message = result.get('message', 'Sem mensagem')
+        success = result.get('success', False)
         
-        print(f"Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            audio_url = result.get('audio_url', 'Sem URL')
-            message = result.get('message', 'Sem mensagem')
-            success = result.get('success', False)
-            
-            print(f"✅ Sucesso: {success}")
-            print(f"📍 URL do áudio: {audio_url}")
-            print(f"💬 Mensagem: {message}")
-            return True
-        else:
-            print(f"❌ Erro HTTP: {response.status_code}")
-            print(f"📄 Resposta: {response.text}")
-            return False
+        lines.append(f"✅ Sucesso: {success}")
+        lines.append(f"📍 URL do áudio: {audio_url}")
+        lines.append(f"💬 Mensagem: {message}")
+        return True
+    else:
+        lines.append(f"❌ Erro HTTP: {response.status_code}")
+        lines.append(f"📄 Resposta: {response.text}")
+        return False
+
+def test_model(model_name, text, language, outcome):
+    """Relata o teste de um modelo de voz específico
+    
+    `outcome` é a resposta (ou a exceção) devolvida por post_all para o
+    pedido deste modelo.
+    """
+    lines = [f"\n🎯 Testando {model_name} ({language})...", f"Texto: '{text}'"]
+    
+    try:
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return report_response(outcome, lines)
             
-    except requests.exceptions.ConnectionError:
-        print("❌ Erro: Não foi possível conectar ao servidor")
+    except CONNECT_ERRORS:
+        lines.append("❌ Erro: Não foi possível conectar ao servidor")
         return False
-    except requests.exceptions.Timeout:
-        print("❌ Erro: Tempo limite excedido")
+    except TIMEOUT_ERRORS:
+        lines.append("❌ Erro: Tempo limite excedido")
         return False
     except Exception as e:
-        print(f"❌ Exceção: {e}")
+        lines.append(f"❌ Exceção: {e}")
         return False
+    finally:
+        print("\n".join(lines))
+
+def run_tests(test_cases):
+    """Executa os testes em paralelo; resultados na ordem de test_cases"""
+    outcomes = asyncio.run(post_all(
+        [(model_name, text) for model_name, text, _ in test_cases], timeout=30
+    ))
+    return [test_model(*case, outcome) for case, outcome in zip(test_cases, outcomes)]
 
 def main():
     """Função principal de teste"""
     print("🚀 Iniciando testes dos modelos de voz...")
     
-    # Aguardar um momento para a aplicação estar pronta
-    time.sleep(2)
-    
     # Testes dos modelos
     test_cases = [
         ('faber_pt_br', 'Olá! Este é um teste do modelo Faber em português.', 'Português Brasil'),
@@ -59,11 +71,9 @@ def main():
         ('voz_teste', 'Olá! Este é um teste da voz de teste.', 'Teste')
     ]
     
-    results = []
-    for model_name, text, language in test_cases:
-        success = test_model(model_name, text, language)
-        results.append((model_name, success))
-        time.sleep(1)  # Pequena pausa entre testes
+    # Testes em paralelo
+    outcomes = run_tests(test_cases)
+    results = [(model_name, success) for (model_name, _, _), success in zip(test_cases, outcomes)]
     
     # Resumo dos resultados
     print("\n" + "="*50)
@@ -9,6 +9,7 @@ import json
 import subprocess
 import threading
 import time
+import uuid
 from pathlib import Path
 import shutil
 from werkzeug.utils import secure_filename
@@ -418,7 +419,8 @@ def test_voice():
             return jsonify({'error': 'Configuração do modelo não encontrada'}), 400
         
         # Gerar áudio de teste usando sistema de inferência melhorado
-        output_file = f"test_{model_name}_{int(time.time())}.wav"
+        # Sufixo aleatório: testes do mesmo modelo no mesmo segundo não se sobrescrevem
+        output_file = f"test_{model_name}_{int(time.time())}_{uuid.uuid4().hex[:8]}.wav"
         output_path = os.path.join('static', 'audio', output_file)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         